@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for StringCalculator.add().
+Measures throughput (ns/number) and peak memory for a set of input shapes at
+sizes from 10 to 10^7 numbers, stores the results as JSON baselines, and
+compares two runs, failing when throughput regresses by more than a threshold.
+Timings are the median of several repeats; fixed-size cases and sizes up to
+MIN_GATED_SIZE are reported but never fail the comparison, since they time
+little more than call overhead and vary too much between runs.
+
+Usage:
+    python benchmarks/bench_calculator.py run [--cases ...] [--sizes ...] [--output FILE]
+    python benchmarks/bench_calculator.py compare BASELINE [CURRENT] [--max-regression PERCENT]
+
+With no CURRENT file, compare runs the cases and sizes found in BASELINE and
+times any benchmark that regressed once more before failing.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import BACKENDS, StringCalculator
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_MAX_REGRESSION = 25.0
+DEFAULT_REPEAT = 7
+# Sizes up to this many numbers are too short to time reliably and are not gated
+MIN_GATED_SIZE = 100
+
+MANY_DELIMITERS = ['***', '%%', ';;;', '##', '@@@', '!!', '&&&', '~~', '^^^', '++',
+                   '<>', '><', '==', '||', '::', '$$', '??', '__', '--', '..']
+
+
+def _numbers(count, low=0, high=1000, seed=42):
+    """Return count random integers as strings."""
+    rng = random.Random(seed)
+    return [str(rng.randint(low, high)) for _ in range(count)]
+
+
+def build_empty(count):
+    """Empty input."""
+    return ""
+
+
+def build_small(count):
+    """Two small numbers, the most common request."""
+    return "1,2"
+
+
+def build_default(count):
+    """Default delimiters (comma and newline)."""
+    values = _numbers(count)
+    return "".join(value + ("\n" if i % 10 == 9 else ",") for i, value in enumerate(values))[:-1]
+
+
+def build_custom_multichar(count):
+    """A single multi-character custom delimiter."""
+    return "//[***]\n" + "***".join(_numbers(count))
+
+
+def build_many_delimiters(count):
+    """Twenty bracketed custom delimiters used in rotation."""
+    header = "//" + "".join(f"[{delim}]" for delim in MANY_DELIMITERS) + "\n"
+    values = _numbers(count)
+    parts = []
+    for i, value in enumerate(values):
+        parts.append(value)
+        parts.append(MANY_DELIMITERS[i % len(MANY_DELIMITERS)])
+    return header + "".join(parts[:-1])
+
+
+def build_negative_heavy(count):
+    """Every other number is negative, so add() raises with a long message."""
+    values = _numbers(count)
+    return ",".join(f"-{value}" if i % 2 else value for i, value in enumerate(values))
+
+
+def build_over_1000_heavy(count):
+    """Nine in ten numbers are above 1000 and ignored."""
+    values = _numbers(count, high=10_000)
+    return ",".join(values)
+
+
+# Case name -> (builder, scales with size)
+CASES = {
+    'empty': (build_empty, False),
+    'small': (build_small, False),
+    'default': (build_default, True),
+    'custom_multichar': (build_custom_multichar, True),
+    'many_delimiters': (build_many_delimiters, True),
+    'negative_heavy': (build_negative_heavy, True),
+    'over_1000_heavy': (build_over_1000_heavy, True),
+}
+
+
+def call_add(calculator, numbers):
+    """Call add(), treating the expected ValueError as a completed call."""
+    try:
+        calculator.add(numbers)
+    except ValueError:
+        pass
+
+
+def measure(calculator, numbers, count, repeat):
+    """Return median ns per call, ns per number and peak memory for one input."""
+    timer = timeit.Timer(lambda: call_add(calculator, numbers))
+    loops, _ = timer.autorange()
+    median = statistics.median(timer.repeat(repeat=repeat, number=loops)) / loops
+
+    tracemalloc.start()
+    call_add(calculator, numbers)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ns_per_call': median * 1e9,
+        'ns_per_number': median * 1e9 / max(count, 1),
+        'peak_memory_bytes': peak,
+        'input_chars': len(numbers)
+    }
+
+
+def run_suite(cases, sizes, repeat, backend='auto'):
+    """Run the selected cases at the selected sizes and return the results."""
+    calculator = StringCalculator(backend=backend)
+    results = {}
+
+    for case in cases:
+        builder, scales = CASES[case]
+        for size in (sizes if scales else [2 if case == 'small' else 0]):
+            numbers = builder(size)
+            key = f"{case}/{size}"
+            results[key] = dict(case=case, numbers=size, **measure(calculator, numbers, size, repeat))
+            print(f"{key:<28} {results[key]['ns_per_number']:>12.1f} ns/number "
+                  f"{results[key]['peak_memory_bytes'] / 1024:>12.1f} KiB peak", flush=True)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': repeat,
+            'backend': backend
+        },
+        'results': results
+    }
+
+
+def rerun(results, keys, repeat, backend='auto'):
+    """Time the given keys again, keeping whichever run of each was faster."""
+    calculator = StringCalculator(backend=backend)
+    for key in keys:
+        entry = results['results'][key]
+        numbers = CASES[entry['case']][0](entry['numbers'])
+        again = dict(case=entry['case'], numbers=entry['numbers'],
+                     **measure(calculator, numbers, entry['numbers'], repeat))
+        if again['ns_per_number'] < entry['ns_per_number']:
+            results['results'][key] = again
+
+
+def is_gated(entry):
+    """Return whether a result is large enough for the regression gate."""
+    scales = CASES.get(entry['case'], (None, False))[1]
+    return scales and entry['numbers'] > MIN_GATED_SIZE
+
+
+def compare_results(baseline, current, max_regression):
+    """Print a comparison table and return the gated keys that regressed."""
+    regressions = []
+
+    print(f"{'benchmark':<28} {'baseline':>12} {'current':>12} {'change':>9}")
+    for key, base in baseline['results'].items():
+        if key not in current['results']:
+            continue
+
+        change = (current['results'][key]['ns_per_number'] / base['ns_per_number'] - 1) * 100
+        marker = ''
+        if not is_gated(base):
+            marker = '  (not gated)'
+        elif change > max_regression:
+            regressions.append(key)
+            marker = '  REGRESSION'
+        print(f"{key:<28} {base['ns_per_number']:>12.1f} {current['results'][key]['ns_per_number']:>12.1f} "
+              f"{change:>+8.1f}%{marker}")
+
+    return regressions
+
+
+def main():
+    """Main function to run or compare benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    run_parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                            help='timing repeats, the median is kept (default: %(default)s)')
+    run_parser.add_argument('--backend', choices=BACKENDS, default='auto', help='calculator backend')
+    run_parser.add_argument('--output', help='write results to this JSON file (e.g. a new baseline)')
+
+    compare_parser = subparsers.add_parser('compare', help='compare results against a baseline')
+    compare_parser.add_argument('baseline', help='baseline JSON file')
+    compare_parser.add_argument('current', nargs='?', help='results JSON file (default: run now)')
+    compare_parser.add_argument('--max-regression', type=float, default=DEFAULT_MAX_REGRESSION,
+                                help='allowed slowdown in percent (default: %(default)s)')
+    compare_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                                help='timing repeats when running now (default: %(default)s)')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        results = run_suite(args.cases, args.sizes, args.repeat, args.backend)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nResults written to {args.output}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        entries = baseline['results'].values()
+        cases = list(dict.fromkeys(entry['case'] for entry in entries))
+        sizes = sorted({entry['numbers'] for entry in entries if CASES[entry['case']][1]})
+        current = run_suite(cases, sizes, args.repeat, baseline['meta'].get('backend', 'auto'))
+        print()
+
+    regressions = compare_results(baseline, current, args.max_regression)
+    if regressions and not args.current:
+        # A slowdown seen once may be a noisy machine, so time those benchmarks again
+        print(f"\nRe-running {len(regressions)} regressed benchmarks\n")
+        rerun(current, regressions, args.repeat, baseline['meta'].get('backend', 'auto'))
+        regressions = compare_results(baseline, current, args.max_regression)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmarks regressed by more than {args.max_regression}%")
+        return 1
+
+    print(f"\n✅ No benchmark regressed by more than {args.max_regression}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark for parallel summation in StringCalculator.add().
+Times the serial scan against the process pool at growing input sizes and
+reports the smallest size where the pool wins (the crossover point).
+
+Usage:
+    python benchmarks/bench_parallel.py [--workers N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StringCalculator
+
+SIZES = [10_000, 30_000, 100_000, 300_000, 1_000_000, 3_000_000]
+
+
+def build_input(count):
+    """Build a default-delimiter input with count numbers."""
+    return ",".join(str(i % 2000) for i in range(count))
+
+
+def best_time(func, numbers, repeat):
+    """Return the best wall time of repeat calls in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(numbers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print a table with the crossover point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='worker processes (default: CPU count)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per size, best time is kept')
+    args = parser.parse_args()
+    
+    # Both sides use the pure-Python scan so only the process pool differs
+    serial = StringCalculator(backend='python')
+    parallel = StringCalculator(parallel_threshold=0, max_workers=args.workers, backend='python')
+    crossover = None
+    
+    try:
+        # Start the workers before timing
+        parallel.add(build_input(args.workers * 10))
+        
+        print(f"Parallel summation benchmark ({args.workers} workers)")
+        print("=" * 60)
+        print(f"{'numbers':>10} {'serial (ms)':>14} {'parallel (ms)':>14} {'speedup':>10}")
+        
+        for count in SIZES:
+            numbers = build_input(count)
+            serial_time = best_time(serial.add, numbers, args.repeat)
+            parallel_time = best_time(parallel.add, numbers, args.repeat)
+            speedup = serial_time / parallel_time
+            print(f"{count:>10} {serial_time * 1000:>14.1f} {parallel_time * 1000:>14.1f} {speedup:>9.2f}x")
+            
+            if crossover is None and speedup > 1:
+                crossover = len(numbers)
+    finally:
+        parallel.close()
+    
+    print("=" * 60)
+    if crossover is None:
+        print("Parallel summation did not beat the serial scan at any measured size")
+    else:
+        print(f"Crossover at about {crossover} characters; use parallel_threshold={crossover}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+String Calculator command-line interface.
+
+Usage:
+    python -m string_calculator sum FILE
+"""
+
+import argparse
+import sys
+
+from string_calculator.string_calculator import StringCalculator
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command-line interface."""
+    parser = argparse.ArgumentParser(
+        prog='python -m string_calculator',
+        description='Sum numbers written in the String Calculator input format.'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    sum_parser = subparsers.add_parser('sum', help='sum the numbers in a file')
+    sum_parser.add_argument('file', help="input file (memory-mapped), or '-' to stream standard input")
+    
+    return parser
+
+
+def main(argv=None) -> int:
+    """Run the command-line interface and return the exit status."""
+    args = build_parser().parse_args(argv)
+    calculator = StringCalculator()
+    
+    try:
+        if args.file == '-':
+            result = calculator.add_stream(sys.stdin.buffer)
+        else:
+            result = calculator.add_file(args.file)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    print(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
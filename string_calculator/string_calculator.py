@@ -1,5 +1,1495 @@
+import codecs
+import copy
+import functools
+import bisect
+import hashlib
+import itertools
+import mmap
+import operator
+import os
 import re
-from typing import List
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python backend is used without it
+    np = None
+
+
+# Numbers greater than this value are ignored when summing
+MAX_NUMBER = 1000
+
+# Delimiters used when no custom delimiter header is given
+DEFAULT_DELIMITERS = [',', '\n', '\t']
+
+# Default number of compiled delimiter specs kept by each calculator
+DEFAULT_CACHE_SIZE = 128
+
+# Default memory budget, in bytes, of the opt-in add() result cache
+DEFAULT_RESULT_CACHE_BYTES = 1024 * 1024
+
+# Inputs longer than this many characters are keyed by their SHA-256 digest in the result cache
+RESULT_CACHE_HASH_THRESHOLD = 256
+
+# Default number of characters (or bytes) read at a time by add_stream
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Longest custom delimiter spec, in characters, add_stream buffers while waiting
+# for the header's newline when the calculator sets no delimiter limits
+MAX_STREAM_HEADER_LENGTH = 1024 * 1024
+
+# Calculation backends accepted by StringCalculator(backend=...)
+BACKENDS = ('auto', 'python', 'numpy')
+
+# Minimum length of the numbers section, in characters, that the 'auto' backend sums with NumPy
+NUMPY_MIN_LENGTH = 1024
+
+# How add() reports negative numbers: all of them, the first one as soon as
+# it is found, or the first max_negatives of them
+NEGATIVE_POLICIES = ('collect-all', 'fail-fast', 'collect-up-to')
+
+# Default number of negatives reported by the 'collect-up-to' policy
+DEFAULT_MAX_NEGATIVES = 100
+
+# Stages of add() timed by a profiler, in the order they run
+PROFILE_STAGES = ('delimiters', 'validate', 'sum')
+
+# Default histogram bucket upper bounds used by StageProfiler
+DEFAULT_SECONDS_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+DEFAULT_TOKENS_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+DEFAULT_BYTES_BUCKETS = (64, 1024, 16 * 1024, 256 * 1024, 4 * 1024 * 1024, 64 * 1024 * 1024)
+
+# Patterns for scanning buffers in place (memoryviews have no find() or isdigit())
+_ASCII_DIGITS = re.compile(rb'[0-9]+')
+_NEWLINE = re.compile(rb'\n')
+
+# Bytes of a buffer whose digit runs are collected at a time by the bytes fast path
+_BUFFER_WINDOW = 64 * 1024
+
+
+class InputTooLargeError(ValueError):
+    """Raised when an input exceeds one of the calculator's configured size limits."""
+
+
+class NegativeNumbersError(ValueError):
+    """
+    Raised when negative numbers are found.
+    
+    The negatives are kept as an array('q') (a list if one does not fit in
+    64 bits) and the message is only formatted when it is read, so inputs
+    with millions of negatives do not build a huge string up front.
+    
+    Attributes:
+        negatives: Negative numbers reported, in input order
+        omitted: Number of further negatives left out by the negative policy
+    """
+    
+    def __init__(self, negatives: Iterable[int], omitted: int = 0):
+        if not (isinstance(negatives, array) and negatives.typecode == 'q'):
+            try:
+                negatives = array('q', negatives)
+            except OverflowError:
+                negatives = list(negatives)
+        
+        super().__init__(negatives, omitted)
+        self.negatives = negatives
+        self.omitted = omitted
+    
+    def __str__(self) -> str:
+        message = f"negative numbers not allowed: {' '.join(map(str, self.negatives))}"
+        if self.omitted:
+            message += f" (and {self.omitted} more)"
+        return message
+
+
+class _ScanTotals:
+    """
+    Running sum and negative numbers collected while scanning.
+    
+    With fail_fast the first negative raises at once; with max_negatives
+    only that many negatives are kept and the rest are just counted.
+    tokens counts the delimiter-separated tokens summed so far, or is None
+    when the path that summed them does not count tokens.
+    """
+    
+    __slots__ = ('total', 'negatives', 'omitted', 'fail_fast', 'max_negatives', 'tokens')
+    
+    def __init__(self, fail_fast: bool = False, max_negatives: Optional[int] = None):
+        self.total = 0
+        self.negatives = []
+        self.omitted = 0
+        self.tokens = None
+        self.fail_fast = fail_fast
+        self.max_negatives = 1 if fail_fast else max_negatives
+    
+    def add_negatives(self, negatives: List[int], omitted: int = 0) -> None:
+        """
+        Add negatives found elsewhere (a worker, NumPy) in input order.
+        
+        Raises:
+            NegativeNumbersError: If fail_fast is set and negatives is not empty
+        """
+        if self.fail_fast:
+            # Only the first negative is reported; the rest are not counted
+            if len(negatives):
+                self.negatives.append(negatives[0])
+                raise self.error()
+            return
+        
+        room = len(negatives) if self.max_negatives is None else max(self.max_negatives - len(self.negatives), 0)
+        self.negatives.extend(negatives[:room])
+        self.omitted += omitted + max(len(negatives) - room, 0)
+    
+    def error(self) -> NegativeNumbersError:
+        """Build the error for the negatives collected so far."""
+        return NegativeNumbersError(self.negatives, self.omitted)
+    
+    def result(self) -> int:
+        """
+        Get the final sum.
+        
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000)
+            
+        Raises:
+            NegativeNumbersError: If any negative numbers were collected
+        """
+        if self.negatives:
+            raise self.error()
+        
+        return self.total
+
+
+class _DelimiterTrie:
+    """
+    Prefix tree of delimiters, compiled into one regex that picks the longest match.
+    
+    Delimiters sharing a prefix share a branch, so at each input position the
+    regex engine follows a single path through the tree instead of trying every
+    delimiter in turn. The work per position is bounded by the longest
+    delimiter, not by how many delimiters were declared.
+    
+    Overlapping delimiters follow the leftmost-longest rule: the match that
+    starts first wins, and among matches starting at the same position the
+    longest one wins (so with [*][**], '**' is a single delimiter).
+    """
+    
+    # Deepest branch nesting compiled as a tree; deeper sets use a sorted alternation
+    MAX_NESTING = 64
+    
+    def __init__(self, delimiters: List[Union[str, bytes]]):
+        self.delimiters = delimiters
+        self._empty = delimiters[0][:0]
+        self._root = {}
+        
+        # None marks the end of a delimiter
+        for delim in delimiters:
+            node = self._root
+            for i in range(len(delim)):
+                node = node.setdefault(delim[i:i + 1], {})
+            node[None] = True
+    
+    def pattern(self) -> Union[str, bytes]:
+        """
+        Get the regex source that matches the longest delimiter at a position.
+        
+        Returns:
+            Regex source (str, or bytes for bytes delimiters)
+        """
+        source = self._node_pattern(self._root, 0)
+        if source is None:
+            # Trying longer delimiters first gives the same leftmost-longest result
+            longest_first = sorted(set(self.delimiters), key=len, reverse=True)
+            source = self._text('|').join(re.escape(delim) for delim in longest_first)
+        
+        return source
+    
+    def _node_pattern(self, node: dict, depth: int) -> Optional[Union[str, bytes]]:
+        """Build the regex for the subtree below a node, or None if it nests too deeply."""
+        if depth > self.MAX_NESTING:
+            return None
+        
+        branches = []
+        for key in sorted(key for key in node if key is not None):
+            # Runs of single-child nodes become one literal
+            literal = [key]
+            child = node[key]
+            while len(child) == 1 and None not in child:
+                (key, child), = child.items()
+                literal.append(key)
+            
+            rest = self._node_pattern(child, depth + 1)
+            if rest is None:
+                return None
+            branches.append(re.escape(self._empty.join(literal)) + rest)
+        
+        if not branches:
+            return self._empty
+        
+        body = branches[0] if len(branches) == 1 else self._group(self._text('|').join(branches))
+        
+        # Greedy optional: try to extend past a delimiter that ends here
+        return self._group(body) + self._text('?') if None in node else body
+    
+    def _group(self, source):
+        """Wrap regex source in a non-capturing group."""
+        return self._text('(?:') + source + self._text(')')
+    
+    def _text(self, text: str):
+        """Convert regex syntax to the delimiters' type."""
+        return text.encode('ascii') if isinstance(self._empty, bytes) else text
+
+
+class _NumberScanner:
+    """
+    Single-pass scanner that sums the numbers section for a fixed set of delimiters.
+    
+    Delimiter matching, integer conversion, negative collection, the > 1000
+    cutoff and the running sum all happen while walking the input once, so no
+    intermediate token or number lists are built. Results and error messages
+    are identical to splitting the section, parsing every token and then
+    checking for negatives as separate steps.
+    """
+    
+    def __init__(self, delimiters: List[Union[str, bytes]]):
+        self.delimiters = delimiters
+        self.max_delimiter_length = max(len(delim) for delim in delimiters)
+        self._delimiter = None
+        self._pattern = None
+        self._bytes_scanner = None
+        self._batch_summer = None
+        self._numpy_summer = None
+        self._outside_delimiters = None
+        self._table = None
+        self._clean_bytes = None
+        
+        # Bytes scanners only accept ASCII digits on the fast path; anything
+        # else is decoded and checked by _convert_token
+        if isinstance(delimiters[0], bytes):
+            self._is_digits = bytes.isdigit
+            open_class, close_class, join = b'[', b']', b''.join
+        else:
+            self._is_digits = str.isdecimal
+            open_class, close_class, join = '[', ']', ''.join
+        
+        if len(delimiters) == 1:
+            # A single delimiter can be located with find()
+            self._delimiter = delimiters[0]
+        elif all(len(delim) == 1 for delim in delimiters):
+            # Single-character delimiters collapse into one character class
+            self._pattern = re.compile(open_class + join(re.escape(delim) for delim in delimiters) + close_class)
+        else:
+            # The trie picks the longest delimiter at each position
+            self._pattern = re.compile(_DelimiterTrie(delimiters).pattern())
+        
+        # Single-character text delimiters can be normalised to the first one with translate()
+        if isinstance(delimiters[0], str) and all(len(delim) == 1 for delim in delimiters):
+            self._table = str.maketrans(dict.fromkeys(delimiters, delimiters[0]))
+        
+        # Buffers of ASCII digits and single-byte delimiters can be checked and
+        # split in place with regular expressions
+        if isinstance(delimiters[0], bytes) and all(len(delim) == 1 and not delim.isdigit() for delim in delimiters):
+            self._clean_bytes = re.compile(b'[0-9' + b''.join(re.escape(delim) for delim in delimiters) + b']*')
+    
+    def for_bytes(self) -> Optional['_NumberScanner']:
+        """
+        Get a scanner that works directly on UTF-8 encoded buffers.
+        
+        UTF-8 never matches a delimiter in the middle of a character, so
+        splitting the encoded buffer on the encoded delimiters gives the same
+        tokens as splitting the decoded text.
+        
+        Returns:
+            The bytes scanner, or None for the empty delimiter, which splits
+            between characters rather than bytes
+        """
+        if self._bytes_scanner is None and '' not in self.delimiters:
+            self._bytes_scanner = _NumberScanner([delim.encode('utf-8') for delim in self.delimiters])
+        
+        return self._bytes_scanner
+    
+    def for_batches(self) -> Optional['_BatchSummer']:
+        """
+        Get a summer that adds many sections with these delimiters at once.
+        
+        Returns:
+            The batch summer, or None when a delimiter is empty or contains an
+            ASCII digit or NUL, which the batch grammar cannot tell apart
+        """
+        if self._batch_summer is None:
+            if any(not delim or '\x00' in delim or any(c in '0123456789' for c in delim)
+                   for delim in self.delimiters):
+                self._batch_summer = False
+            else:
+                self._batch_summer = _BatchSummer(self.delimiters)
+        
+        return self._batch_summer or None
+    
+    def for_numpy(self) -> Optional['_NumpySummer']:
+        """
+        Get a summer that parses sections with vectorised NumPy operations.
+        
+        Returns:
+            The NumPy summer, or None when NumPy is not installed or the
+            delimiter is empty
+        """
+        if self._numpy_summer is None:
+            if np is None or '' in self.delimiters:
+                self._numpy_summer = False
+            else:
+                self._numpy_summer = _NumpySummer(self.delimiters)
+        
+        return self._numpy_summer or None
+    
+    def chunk_boundaries(self, numbers: str, parts: int) -> List[int]:
+        """
+        Split the numbers section into roughly equal pieces at token boundaries.
+        
+        Each cut is placed after the first delimiter that follows a character
+        which belongs to no delimiter. No delimiter can span such a character,
+        so a sequential scan splits the input at exactly the same place and
+        every piece can be scanned independently.
+        
+        Args:
+            numbers: String containing numbers (without the custom delimiter header)
+            parts: Desired number of pieces
+            
+        Returns:
+            Increasing list of indexes starting with 0 and ending with len(numbers)
+        """
+        end = len(numbers)
+        boundaries = [0]
+        
+        if '' in self.delimiters:
+            # The empty delimiter splits between every character
+            boundaries.extend(end * i // parts for i in range(1, parts))
+        else:
+            if self._outside_delimiters is None:
+                delimiter_chars = ''.join(sorted(set(''.join(self.delimiters))))
+                self._outside_delimiters = re.compile('[^' + re.escape(delimiter_chars) + ']')
+            
+            for i in range(1, parts):
+                anchor = self._outside_delimiters.search(numbers, max(boundaries[-1], end * i // parts))
+                if anchor is None:
+                    break
+                
+                if self._pattern is not None:
+                    match = self._pattern.search(numbers, anchor.start())
+                    if match is None:
+                        break
+                    boundaries.append(match.end())
+                else:
+                    found = numbers.find(self._delimiter, anchor.start())
+                    if found == -1:
+                        break
+                    boundaries.append(found + len(self._delimiter))
+        
+        boundaries.append(end)
+        return boundaries
+    
+    def number_bound(self, numbers: str) -> int:
+        """
+        Get a cheap upper bound on the number of numbers in a section.
+        
+        Args:
+            numbers: String containing numbers (without the custom delimiter header)
+            
+        Returns:
+            A count that the numbers in the section cannot exceed
+        """
+        if self._delimiter is None and self._table is None:
+            # Numbers are separated by at least one character
+            return (len(numbers) + 1) // 2
+        
+        return self.count_tokens(numbers)
+    
+    def count_tokens(self, numbers: str) -> int:
+        """
+        Count the delimiter-separated tokens in a section, including empty ones.
+        
+        Args:
+            numbers: String containing numbers (without the custom delimiter header)
+            
+        Returns:
+            Number of tokens the section splits into
+        """
+        if self._delimiter == '':
+            # An empty delimiter makes every character a token; an empty
+            # section is one empty token, as with any other delimiter
+            return len(numbers) or 1
+        if self._delimiter is not None:
+            return numbers.count(self._delimiter) + 1
+        if self._table is not None:
+            return sum(map(numbers.count, self.delimiters)) + 1
+        
+        return sum(1 for _ in self._pattern.finditer(numbers)) + 1
+    
+    def scan(self, numbers: str, max_numbers: Optional[int] = None, totals: Optional[_ScanTotals] = None,
+             pos: int = 0) -> int:
+        """
+        Sum the numbers in a string in a single pass.
+        
+        Args:
+            numbers: String containing numbers (without the custom delimiter header),
+                or a buffer for a bytes scanner
+            max_numbers: Maximum number of numbers allowed in the section (None for no limit)
+            totals: Empty totals carrying the negative policy (collect all by default)
+            pos: Index the section starts at
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000)
+            
+        Raises:
+            ValueError: If a token is not an integer
+            NegativeNumbersError: If negative numbers are found
+            InputTooLargeError: If the section has more than max_numbers numbers
+        """
+        if totals is None:
+            totals = _ScanTotals()
+        
+        if self._table is not None and max_numbers is None and not pos:
+            total = self._sum_digits(numbers, totals)
+            if total is not None:
+                return total
+        elif self._clean_bytes is not None:
+            total = self._sum_buffer_digits(numbers, pos, max_numbers)
+            if total is not None:
+                return total
+        
+        self.feed(numbers, totals, pos=pos, max_numbers=max_numbers)
+        return totals.result()
+    
+    def _sum_digits(self, numbers: str, totals: _ScanTotals) -> Optional[int]:
+        """
+        Sum a section made only of digits and single-character delimiters.
+        
+        Every delimiter is translated to the first one and the section is
+        split and converted with C-level calls. Sections containing anything else
+        (signs, spaces, decimal points, garbage) cannot be summed this way.
+        
+        Args:
+            numbers: String containing numbers (without the custom delimiter header)
+            totals: Totals whose token count is set when the section is summed
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000), or None when the
+            section needs the full scan, which raises the usual errors
+        """
+        separator = self.delimiters[0]
+        normalized = numbers.translate(self._table)
+        if not normalized.replace(separator, '').isdecimal():
+            return None
+        
+        tokens = normalized.split(separator)
+        try:
+            total = sum(filter(MAX_NUMBER.__ge__, map(int, filter(None, tokens))))
+        except ValueError:
+            # Digit runs too long to convert are reported by the full scan
+            return None
+        
+        totals.tokens = len(tokens)
+        return total
+    
+    def _sum_buffer_digits(self, buf, pos: int, max_numbers: Optional[int]) -> Optional[int]:
+        """
+        Sum a buffer section made only of ASCII digits and single-byte delimiters.
+        
+        The section is checked and its digit runs found by C-level regular
+        expression calls over the buffer itself. Digit runs are collected one
+        window at a time, so memory use stays flat however large the buffer is.
+        
+        Args:
+            buf: Bytes-like object holding the section
+            pos: Index the section starts at
+            max_numbers: Maximum number of numbers allowed in the section (None for no limit)
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000), or None when the
+            section needs the full scan, which raises the usual errors
+        """
+        if self._clean_bytes.fullmatch(buf, pos) is None:
+            return None
+        
+        total = 0
+        count = 0
+        end = len(buf)
+        while pos < end:
+            # Stretch the window to the end of the digit run it would split
+            stop = min(pos + _BUFFER_WINDOW, end)
+            run = _ASCII_DIGITS.match(buf, stop)
+            if run is not None:
+                stop = run.end()
+            
+            digits = _ASCII_DIGITS.findall(buf, pos, stop)
+            count += len(digits)
+            if max_numbers is not None and count > max_numbers:
+                return None
+            
+            try:
+                total += sum(filter(MAX_NUMBER.__ge__, map(int, digits)))
+            except ValueError:
+                # Digit runs too long to convert are reported by the full scan
+                return None
+            pos = stop
+        
+        return total
+    
+    def feed(self, numbers, totals: _ScanTotals, final: bool = True, pos: int = 0,
+             max_numbers: Optional[int] = None) -> int:
+        """
+        Scan tokens from a piece of the numbers section into running totals.
+        
+        When final is False the text is treated as a prefix of a longer input:
+        scanning stops before the first token whose terminating delimiter could
+        still change once more text arrives, so the caller can prepend the
+        unconsumed remainder to the next piece.
+        
+        Args:
+            numbers: Text to scan (str, or bytes, mmap or memoryview for a bytes scanner)
+            totals: Running sum and negatives to update
+            final: Whether the text runs to the end of the input
+            pos: Index to start scanning at
+            max_numbers: Maximum number of numbers to accept (None for no limit)
+            
+        Returns:
+            Index of the first character that was not consumed
+            
+        Raises:
+            ValueError: If a token is not an integer
+            NegativeNumbersError: If a negative is found and totals.fail_fast is set
+            InputTooLargeError: If more than max_numbers numbers are found
+        """
+        total = totals.total
+        negatives = totals.negatives
+        # Negatives kept before the rest are only counted
+        kept = totals.max_negatives if totals.max_negatives is not None else sys.maxsize
+        is_digits = self._is_digits
+        delimiter = self._delimiter
+        search = self._pattern.search if self._pattern is not None else None
+        if isinstance(numbers, memoryview):
+            # Views are matched in place; their tokens are views too, not copies
+            is_digits = _ASCII_DIGITS.fullmatch
+            if delimiter is not None:
+                search = re.compile(re.escape(delimiter)).search
+        step = len(delimiter) if delimiter is not None else 0
+        end = len(numbers)
+        # A delimiter starting after this index may still grow into a longer match
+        last_safe = end if final else end - self.max_delimiter_length
+        # Numbers still allowed before the scan is aborted
+        remaining = max_numbers if max_numbers is not None else -1
+        tokens = 0
+        
+        while True:
+            # Locate the next delimiter and the position the following token starts at
+            if search is not None:
+                match = search(numbers, pos)
+                if match is None:
+                    token_end = -1
+                else:
+                    token_end, next_pos = match.span()
+            elif step:
+                token_end = numbers.find(delimiter, pos)
+                next_pos = token_end + step
+            else:
+                # An empty delimiter splits between every character
+                token_end = next_pos = pos + 1 if pos < end else -1
+            
+            if token_end == -1 or token_end > last_safe:
+                if not final:
+                    break
+                token_end = next_pos = end
+            
+            token = numbers[pos:token_end]
+            tokens += 1
+            if remaining == 0 and _as_text(token).strip():
+                raise InputTooLargeError(f"Input too large: more than {max_numbers} numbers")
+            
+            if is_digits(token):
+                try:
+                    value = int(token)
+                except ValueError:
+                    raise ValueError(f"Invalid input: cannot convert to integer: {_as_text(token)}")
+                if value <= MAX_NUMBER:
+                    total += value
+                remaining -= 1
+            else:
+                value = _convert_token(token)
+                if value is not None:
+                    if value < 0:
+                        if len(negatives) < kept:
+                            negatives.append(value)
+                            if totals.fail_fast:
+                                raise totals.error()
+                        else:
+                            totals.omitted += 1
+                    elif value <= MAX_NUMBER:
+                        total += value
+                    remaining -= 1
+            
+            pos = next_pos
+            if token_end >= end:
+                break
+        
+        totals.total = total
+        totals.tokens = (totals.tokens or 0) + tokens
+        return pos
+
+
+class _BatchSummer:
+    """
+    Sums many numbers sections that share one set of delimiters.
+    
+    Sections that consist only of ASCII digits separated by single
+    delimiters, with optional spaces around each number, cannot raise an
+    error. Their delimiters are normalised to ',' and the whole batch is
+    validated, split and converted with a handful of C-level calls instead
+    of one scanner pass per section. Only when that check fails is each
+    section checked on its own, and only the clean ones are summed.
+    """
+    
+    # Joins sections in a batch; never accepted inside a clean section
+    SEPARATOR = '\x00'
+    
+    # Normalised numbers separated by ',' with no empty tokens
+    _CLEAN = re.compile(rb'[0-9]+(?:,[0-9]+)*')
+    
+    def __init__(self, delimiters: List[str]):
+        self._delimiter = None
+        self._table = None
+        self._pattern = None
+        # A ',' that is not a delimiter is part of a (bad) token
+        self._comma_is_delimiter = ',' in delimiters
+        
+        if all(len(delim) == 1 for delim in delimiters):
+            self._table = str.maketrans(dict.fromkeys(delimiters, ','))
+        elif len(delimiters) == 1:
+            self._delimiter = delimiters[0]
+        else:
+            self._pattern = re.compile(_DelimiterTrie(delimiters).pattern())
+    
+    def sum_all(self, sections: List[str], max_numbers: Optional[int] = None,
+                numpy_min_length: Optional[int] = None) -> List[Optional[int]]:
+        """
+        Sum every clean section.
+        
+        Args:
+            sections: Numbers sections (without the custom delimiter header)
+            max_numbers: Maximum number of numbers in a section (None for no limit)
+            numpy_min_length: Minimum length of the clean sections together, in
+                characters, that are converted with NumPy (None never uses NumPy)
+            
+        Returns:
+            Sum of each section in order, or None for sections that need the
+            full add() path (other whitespace, negatives, errors, repeated
+            delimiters, more than max_numbers numbers, digit runs too long for int())
+        """
+        if not sections:
+            return []
+        
+        joined = self.SEPARATOR.join(sections)
+        if (not joined.isascii() or joined.count(self.SEPARATOR) != len(sections) - 1
+                or (not self._comma_is_delimiter and ',' in joined)):
+            # Characters the normalised batch cannot represent are left to add()
+            usable = [section.isascii() and self.SEPARATOR not in section
+                      and (self._comma_is_delimiter or ',' not in section) for section in sections]
+            return _expand(usable, self.sum_all(list(itertools.compress(sections, usable)), max_numbers,
+                                                numpy_min_length))
+        
+        # Normalise every delimiter to ',' so plain bytes.split does the tokenising
+        if self._table is not None:
+            normalized = joined.translate(self._table)
+        elif self._delimiter is not None:
+            normalized = joined.replace(self._delimiter, ',')
+        else:
+            normalized = self._pattern.sub(',', joined)
+        data = normalized.encode('ascii')
+        if b' ' in data:
+            # Spaces around numbers are stripped like add() does. Runs of spaces
+            # are shortened first; a space inside a number is never removed and
+            # fails the check below
+            while b'  ' in data:
+                data = data.replace(b'  ', b' ')
+            data = data.replace(b' ,', b',').replace(b', ', b',').replace(b' \x00', b'\x00').replace(b'\x00 ', b'\x00')
+            data = data.strip(b' ')
+        
+        parts = data.split(b'\x00')
+        clean = None
+        if (not data or data.translate(None, b'0123456789,\x00') or b',,' in data or b',\x00' in data
+                or b'\x00,' in data or b'\x00\x00' in data or data[0] in b',\x00' or data[-1] in b',\x00'):
+            # Check the sections one by one and sum only the clean ones
+            clean = list(map(self._CLEAN.fullmatch, parts))
+            parts = list(itertools.compress(parts, clean))
+            if not parts:
+                return [None] * len(sections)
+        
+        counts = list(map(bytes.count, parts, itertools.repeat(b',')))
+        if max_numbers is not None and max(counts) >= max_numbers:
+            # Sections over the limit are left to add(), which reports the error
+            fits = [count < max_numbers for count in counts]
+            parts = list(itertools.compress(parts, fits))
+            counts = list(itertools.compress(counts, fits))
+            clean = _expand(clean, fits) if clean is not None else fits
+            if not parts:
+                return [None] * len(sections)
+        
+        numbers = b','.join(parts)
+        if np is not None and numpy_min_length is not None and len(numbers) >= numpy_min_length:
+            sums = self._sum_numpy(numbers, counts)
+            if sums is not None:
+                return sums if clean is None else _expand(clean, sums)
+        
+        try:
+            values = list(map(int, numbers.split(b',')))
+        except ValueError:
+            # Digit runs too long to convert are reported by add()
+            return [None] * len(sections)
+        
+        # Zero out numbers > 1000 only when there are any
+        if max(values) > MAX_NUMBER:
+            values = [value if value <= MAX_NUMBER else 0 for value in values]
+        
+        prefix = list(itertools.accumulate(values, initial=0))
+        totals = list(map(prefix.__getitem__, itertools.accumulate(count + 1 for count in counts)))
+        sums = list(map(operator.sub, totals, [0] + totals[:-1]))
+        return sums if clean is None else _expand(clean, sums)
+    
+    @staticmethod
+    def _sum_numpy(numbers: bytes, counts: List[int]) -> Optional[List[int]]:
+        """
+        Sum validated sections joined by ',' with vectorised NumPy operations.
+        
+        Args:
+            numbers: Digit runs of every section joined by ','
+            counts: Number of ',' inside each section
+            
+        Returns:
+            Sum of each section in order, or None when a digit run overflows int64
+        """
+        values = np.fromstring(numbers, dtype=np.int64, sep=',')
+        if (values == np.iinfo(np.int64).max).any():
+            # Digit runs that overflow int64 are converted by the pure-Python path
+            return None
+        
+        values[values > MAX_NUMBER] = 0
+        ends = np.cumsum(np.array(counts, dtype=np.int64) + 1) - 1
+        return np.diff(np.cumsum(values)[ends], prepend=0).tolist()
+
+
+class _NumpySummer:
+    """
+    Sums a numbers section with NumPy.
+    
+    Delimiters are normalised to ',' and the section is checked to hold only
+    digits, separators and leading minus signs with C-level bytes calls, then
+    parsed into an int64 array in one np.fromstring call. Negative detection,
+    the > 1000 cutoff and the sum are vectorised mask operations. Sections
+    that fail the check are left to the pure-Python scanner, which raises the
+    usual errors.
+    """
+    
+    SEPARATOR = ','
+    
+    def __init__(self, delimiters: List[str]):
+        self._delimiter = None
+        self._table = None
+        self._pattern = None
+        # A ',' that is not a delimiter is part of a (bad) token
+        self._comma_is_delimiter = self.SEPARATOR in delimiters
+        
+        if all(len(delim) == 1 for delim in delimiters):
+            self._table = str.maketrans(dict.fromkeys(delimiters, self.SEPARATOR))
+        elif len(delimiters) == 1:
+            self._delimiter = delimiters[0]
+        else:
+            self._pattern = re.compile(_DelimiterTrie(delimiters).pattern())
+    
+    def sum(self, numbers: str, totals: Optional[_ScanTotals] = None) -> Optional[int]:
+        """
+        Sum a numbers section.
+        
+        Args:
+            numbers: String containing numbers (without the custom delimiter header)
+            totals: Empty totals carrying the negative policy (collect all by default)
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000), or None when the
+            section needs the pure-Python scanner
+            
+        Raises:
+            NegativeNumbersError: If negative numbers are found
+        """
+        if not numbers.isascii() or (not self._comma_is_delimiter and self.SEPARATOR in numbers):
+            return None
+        
+        if self._table is not None:
+            normalized = numbers.translate(self._table)
+        elif self._delimiter is not None:
+            normalized = numbers.replace(self._delimiter, self.SEPARATOR)
+        else:
+            normalized = self._pattern.sub(self.SEPARATOR, numbers)
+        data = normalized.encode('ascii')
+        
+        # Only digits, separators and minus signs at the start of a token may remain
+        signs = data.translate(None, b'0123456789,')
+        if signs:
+            if (signs.count(b'-') != len(signs) or len(signs) != data.count(b',-') + data.startswith(b'-')
+                    or b'--' in data or b'-,' in data or data.endswith(b'-')):
+                return None
+        
+        tokens = data.count(b',') + 1
+        
+        # Empty tokens are skipped
+        if b',,' in data or data.startswith(b',') or data.endswith(b','):
+            data = re.sub(rb',{2,}', b',', data).strip(b',')
+            if not data:
+                if totals is not None:
+                    totals.tokens = tokens
+                return 0
+        
+        # The checks above guarantee np.fromstring reads every token
+        values = np.fromstring(data, dtype=np.int64, sep=self.SEPARATOR)
+        if (values == np.iinfo(np.int64).max).any():
+            # Digit runs that overflow int64 are converted by the pure-Python scanner
+            return None
+        
+        negatives = values[values < 0]
+        if negatives.size:
+            if totals is None:
+                totals = _ScanTotals()
+            # Hand over only the negatives the policy keeps
+            kept = negatives.size if totals.max_negatives is None else min(totals.max_negatives, negatives.size)
+            totals.add_negatives(array('q', negatives[:kept].tobytes()), negatives.size - kept)
+            return totals.result()
+        
+        if totals is not None:
+            totals.tokens = tokens
+        return int(values[values <= MAX_NUMBER].sum())
+
+
+def _expand(mask: List[bool], values: List[Optional[int]]) -> List[Optional[int]]:
+    """Spread values over the positions where mask is true, putting None everywhere else."""
+    values = iter(values)
+    return [next(values) if ok else None for ok in mask]
+
+
+def _as_text(token) -> str:
+    """Return a token as str, decoding UTF-8 bytes for use in messages."""
+    if isinstance(token, str):
+        return token
+    
+    return bytes(token).decode('utf-8', 'replace')
+
+
+def _convert_token(token):
+    """
+    Convert a token that is not a plain run of digits.
+    
+    Args:
+        token: Raw text between two delimiters (str or UTF-8 bytes)
+        
+    Returns:
+        The integer value, or None if the token is empty or only whitespace
+        
+    Raises:
+        ValueError: If the token is a decimal or non-integer number
+    """
+    stripped = _as_text(token).strip()
+    if not stripped:
+        return None
+    
+    if '.' in stripped:
+        raise ValueError(f"Invalid input: decimal numbers not allowed: {stripped}")
+    
+    if not (stripped.isdecimal() or (stripped[0] == '-' and stripped[1:].isdecimal())):
+        raise ValueError(f"Invalid input: non-integer number not allowed: {stripped}")
+    
+    try:
+        return int(stripped)
+    except ValueError:
+        raise ValueError(f"Invalid input: cannot convert to integer: {stripped}")
+
+
+def _iter_text_chunks(source, chunk_size: int) -> Iterator[str]:
+    """
+    Yield text chunks from a file-like object, an iterable of chunks or a string.
+    
+    Bytes chunks are decoded incrementally as UTF-8, so multi-byte characters
+    split between chunks are handled.
+    
+    Args:
+        source: Object with a read() method, iterable of str/bytes chunks, or a str
+        chunk_size: Number of characters or bytes requested per read() call
+    """
+    if isinstance(source, str):
+        yield source
+        return
+    
+    read = getattr(source, 'read', None)
+    if read is not None:
+        # Stop at the first empty read; read(0) is not used to probe for the
+        # empty value since some streams (e.g. WSGI inputs) treat it as a disconnect
+        chunks = itertools.takewhile(len, iter(lambda: read(chunk_size), None))
+    else:
+        chunks = iter(source)
+    
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder('utf-8')()
+            yield decoder.decode(chunk)
+        else:
+            raise TypeError(f"stream chunks must be str or bytes, not {type(chunk).__name__}")
+    
+    if decoder is not None:
+        yield decoder.decode(b'', final=True)
+
+
+def _compress_tail(tail: str, text: str) -> str:
+    """
+    Fold more input into a short summary of the end of the input.
+    
+    The summary keeps the last non-whitespace character and a newline if one
+    follows it, which is all _validate_input_format needs to detect a
+    trailing delimiter.
+    
+    Args:
+        tail: Summary of the input seen so far
+        text: Next piece of input
+        
+    Returns:
+        Summary of the input including text
+    """
+    stripped = text.rstrip()
+    if stripped:
+        tail = stripped[-1]
+        text = text[len(stripped):]
+    
+    if '\n' in text and not tail.endswith('\n'):
+        tail += '\n'
+    
+    return tail
+
+
+def _ends_with_comma_line(text: str) -> bool:
+    """
+    Check whether text ends with a ',' followed by whitespace containing a newline.
+    
+    Searching for this with a regex from the start of the text can take
+    quadratic time on long whitespace runs, so only a window at the end of
+    the text is stripped; the window grows until it reaches a non-whitespace
+    character or the start of the text.
+    
+    Args:
+        text: Numbers section, or a summary of its end from _compress_tail
+    """
+    size = 64
+    while True:
+        window = text[-size:]
+        stripped = window.rstrip()
+        if stripped or len(window) == len(text):
+            return stripped.endswith(',') and '\n' in window[len(stripped):]
+        size *= 4
+
+
+def _buffer_tail(buf, start: int) -> str:
+    """
+    Summarise the end of a UTF-8 buffer the same way as _compress_tail.
+    
+    Only a window at the end of the buffer is decoded; the window grows
+    until it reaches a non-whitespace character or the start of the numbers.
+    
+    Args:
+        buf: Bytes-like object supporting len(), indexing and slicing
+        start: Index where the numbers section begins
+        
+    Returns:
+        Summary of the numbers section for _validate_input_format
+    """
+    end = len(buf)
+    size = 64
+    while True:
+        window_start = max(start, end - size)
+        # Move forward to the start of a UTF-8 character
+        while window_start < end and window_start > start and buf[window_start] & 0xC0 == 0x80:
+            window_start += 1
+        
+        text = bytes(buf[window_start:end]).decode('utf-8', 'replace')
+        if text.strip() or window_start == start:
+            return _compress_tail('', text)
+        size *= 4
+
+
+@functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _worker_scanner(delimiters: tuple) -> _NumberScanner:
+    """Get a scanner inside a worker process, compiling each delimiter set once."""
+    return _NumberScanner(list(delimiters))
+
+
+def _scan_chunk(delimiters: tuple, numbers: str, fail_fast: bool = False,
+                max_negatives: Optional[int] = None) -> tuple:
+    """
+    Scan one piece of the numbers section in a worker process.
+    
+    Args:
+        delimiters: Delimiters of the input
+        numbers: Piece of the numbers section cut at a token boundary
+        fail_fast: Raise on the first negative
+        max_negatives: Number of negatives to keep (None keeps all)
+        
+    Returns:
+        Tuple of (sum of the piece, negatives kept in input order, count of other negatives)
+        
+    Raises:
+        ValueError: If a token is not an integer
+        NegativeNumbersError: If a negative is found and fail_fast is set
+    """
+    totals = _ScanTotals(fail_fast, max_negatives)
+    scanner = _worker_scanner(delimiters)
+    # Clean pieces take the same translate/split fast path as the serial scan
+    if scanner._table is not None:
+        total = scanner._sum_digits(numbers, totals)
+        if total is not None:
+            return total, totals.negatives, totals.omitted
+    
+    scanner.feed(numbers, totals)
+    return totals.total, totals.negatives, totals.omitted
+
+
+class _DelimiterCache:
+    """
+    Bounded LRU cache of compiled scanners keyed by the raw delimiter spec.
+    
+    Lookups and inserts are guarded by a lock so one cache can be shared by
+    all threads of a worker process.
+    """
+    
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("cache size must be zero or a positive integer")
+        
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str, factory: Callable[[str], _NumberScanner]) -> _NumberScanner:
+        """
+        Return the cached value for key, building it with factory on a miss.
+        
+        Args:
+            key: Raw delimiter specification
+            factory: Callable that compiles a scanner from the specification
+            
+        Returns:
+            The compiled scanner for the specification
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        
+        # Compile outside the lock so other threads are not blocked meanwhile
+        value = factory(key)
+        
+        if self.maxsize == 0:
+            return value
+        
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        
+        return value
+    
+    def info(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters along with the current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'maxsize': self.maxsize,
+                'currsize': len(self._entries)
+            }
+    
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+class _ResultCache:
+    """
+    Bounded LRU cache of add() outcomes keyed by the input string.
+    
+    Both sums and ValueErrors are stored, so a repeated bad input raises the
+    same error without being parsed again. The cache is limited
+    by entry count and by the approximate memory held by keys and outcomes.
+    """
+    
+    def __init__(self, maxsize: int = 0, maxbytes: int = DEFAULT_RESULT_CACHE_BYTES):
+        if maxsize < 0:
+            raise ValueError("result cache size must be zero or a positive integer")
+        if maxbytes < 0:
+            raise ValueError("result cache bytes must be zero or a positive integer")
+        
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def key(numbers: str) -> Union[str, bytes]:
+        """Get the cache key for an input: the string itself, or a digest of long inputs."""
+        if len(numbers) <= RESULT_CACHE_HASH_THRESHOLD:
+            return numbers
+        
+        return hashlib.sha256(numbers.encode('utf-8', 'surrogatepass')).digest()
+    
+    def get(self, numbers: str, compute: Callable[[str], int]) -> Tuple[bool, Union[int, ValueError]]:
+        """
+        Return the cached outcome for an input, computing it on a miss.
+        
+        Args:
+            numbers: Input string in the format accepted by add()
+            compute: Callable that sums the input, raising ValueError if invalid
+            
+        Returns:
+            Tuple of (True, sum) or (False, the stored copy of the ValueError
+            raised); callers raise a copy of the error, never the stored one
+        """
+        key = self.key(numbers)
+        with self._lock:
+            outcome = self._entries.get(key)
+            if outcome is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return outcome
+            self.misses += 1
+        
+        # Compute outside the lock so other threads are not blocked meanwhile
+        try:
+            outcome = (True, compute(numbers))
+        except ValueError as e:
+            # Store a copy, which has no traceback or context to keep alive
+            outcome = (False, copy.copy(e))
+        
+        cost = self._cost(key, outcome)
+        if cost > self.maxbytes:
+            return outcome
+        
+        with self._lock:
+            if key in self._entries:
+                return outcome
+            
+            self._entries[key] = outcome
+            self.currbytes += cost
+            while len(self._entries) > self.maxsize or self.currbytes > self.maxbytes:
+                old_key, old_outcome = self._entries.popitem(last=False)
+                self.currbytes -= self._cost(old_key, old_outcome)
+                self.evictions += 1
+        
+        return outcome
+    
+    @staticmethod
+    def _cost(key: Union[str, bytes], outcome: tuple) -> int:
+        """Approximate the memory held by an entry."""
+        succeeded, value = outcome
+        if succeeded:
+            size = sys.getsizeof(value)
+        elif isinstance(value, NegativeNumbersError):
+            # Measure the stored negatives rather than formatting the message
+            size = sys.getsizeof(value.negatives)
+        else:
+            size = sys.getsizeof(str(value))
+        return sys.getsizeof(key) + size
+    
+    def info(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters along with the current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'maxsize': self.maxsize,
+                'currsize': len(self._entries),
+                'maxbytes': self.maxbytes,
+                'currbytes': self.currbytes
+            }
+    
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+class _Histogram:
+    """Counts of observed values per bucket, with their sum."""
+    
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = tuple(bounds)
+        # One count per bucket plus a final overflow bucket
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def export(self) -> Dict[str, object]:
+        """
+        Export the histogram with cumulative bucket counts.
+        
+        Returns:
+            Dictionary with 'buckets' (list of (upper bound, cumulative count),
+            ending with float('inf')), 'sum' and 'count'
+        """
+        cumulative = itertools.accumulate(self.counts)
+        return {
+            'buckets': list(zip(self.bounds + (float('inf'),), cumulative)),
+            'sum': self.sum,
+            'count': self.count
+        }
+
+
+class StageProfiler:
+    """
+    Aggregates add() profiles into histograms.
+    
+    Pass an instance as StringCalculator(profiler=...). Each profiled call adds
+    its stage wall times, token count and input size to per-stage histograms.
+    Any object with the same record() method can be used instead, for example
+    to forward every call to a metrics library.
+    """
+    
+    def __init__(self, seconds_buckets: Tuple[float, ...] = DEFAULT_SECONDS_BUCKETS,
+                 tokens_buckets: Tuple[int, ...] = DEFAULT_TOKENS_BUCKETS,
+                 bytes_buckets: Tuple[int, ...] = DEFAULT_BYTES_BUCKETS):
+        self._seconds_buckets = tuple(seconds_buckets)
+        self._tokens_buckets = tuple(tokens_buckets)
+        self._bytes_buckets = tuple(bytes_buckets)
+        self._lock = threading.Lock()
+        self.clear()
+    
+    def record(self, stages: Dict[str, float], tokens: int, nbytes: int, error: bool) -> None:
+        """
+        Record one add() call.
+        
+        Args:
+            stages: Wall time in seconds of each stage that ran, keyed by the
+                names in PROFILE_STAGES, plus 'total' for the whole call
+            tokens: Number of delimiter-separated tokens in the numbers section
+            nbytes: Size of the input in bytes (UTF-8)
+            error: Whether the call raised an exception
+        """
+        with self._lock:
+            for stage, seconds in stages.items():
+                histogram = self._stages.get(stage)
+                if histogram is None:
+                    histogram = self._stages[stage] = _Histogram(self._seconds_buckets)
+                histogram.observe(seconds)
+            self._tokens.observe(tokens)
+            self._bytes.observe(nbytes)
+            self.calls += 1
+            self.errors += error
+    
+    def histograms(self) -> Dict[str, object]:
+        """
+        Export the aggregated histograms.
+        
+        Returns:
+            Dictionary with 'calls', 'errors', 'stage_seconds' (a histogram per
+            stage), 'tokens' and 'bytes'; see _Histogram.export for the format
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'errors': self.errors,
+                'stage_seconds': {stage: histogram.export() for stage, histogram in self._stages.items()},
+                'tokens': self._tokens.export(),
+                'bytes': self._bytes.export()
+            }
+    
+    def clear(self) -> None:
+        """Discard all recorded calls."""
+        with self._lock:
+            self._stages = {}
+            self._tokens = _Histogram(self._tokens_buckets)
+            self._bytes = _Histogram(self._bytes_buckets)
+            self.calls = 0
+            self.errors = 0
+
+
+class Accumulator:
+    """
+    Running sum of an append-only numbers section fed in pieces.
+    
+    Each feed() scans only the new text plus the unfinished token left over
+    from the previous feed, so summing a growing ledger costs time in
+    proportion to what was appended rather than to the whole ledger. Create
+    one with StringCalculator.accumulator().
+    """
+    
+    def __init__(self, calculator: 'StringCalculator', delimiter_spec: Optional[str] = None):
+        self._calculator = calculator
+        self.delimiter_spec = delimiter_spec
+        self._scanner = calculator._get_scanner(delimiter_spec)
+        self._totals = calculator._new_totals()
+        self._pending = ''
+        self._tail = ''
+    
+    def feed(self, text: str) -> None:
+        """
+        Append text to the numbers section.
+        
+        Tokens and delimiters split between feeds are carried over, so the
+        text can be cut anywhere.
+        
+        Args:
+            text: Next piece of the numbers section (without a delimiter header)
+            
+        Raises:
+            ValueError: If a completed token is not an integer; nothing from
+                text is consumed then, so the accumulator is left unchanged
+        """
+        if not text:
+            return
+        
+        pending = self._pending + text if self._pending else text
+        totals = self._totals
+        negatives_seen = len(totals.negatives)
+        omitted = totals.omitted
+        try:
+            consumed = self._scanner.feed(pending, totals, final=False)
+        except ValueError:
+            del totals.negatives[negatives_seen:]
+            totals.omitted = omitted
+            raise
+        
+        self._pending = pending[consumed:]
+        self._tail = _compress_tail(self._tail, text)
+    
+    def _pending_totals(self) -> _ScanTotals:
+        """Scan the unfinished last token as if the input ended after it."""
+        totals = _ScanTotals()
+        self._scanner.feed(self._pending, totals)
+        return totals
+    
+    @property
+    def total(self) -> int:
+        """
+        Sum of the numbers fed so far, as if the input ended here.
+        
+        Numbers > 1000 and negative numbers are not included.
+        
+        Raises:
+            ValueError: If the unfinished last token is not an integer
+        """
+        return self._totals.total + self._pending_totals().total
+    
+    @property
+    def negatives(self) -> List[int]:
+        """
+        Negative numbers fed so far, in input order.
+        
+        Raises:
+            ValueError: If the unfinished last token is not an integer
+        """
+        return self._totals.negatives + self._pending_totals().negatives
+    
+    def result(self) -> int:
+        """
+        Get the sum of everything fed so far, with the same checks as add().
+        
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000)
+            
+        Raises:
+            ValueError: If the input ends with a trailing delimiter or the last
+                token is not an integer
+            NegativeNumbersError: If negative numbers were fed
+        """
+        self._calculator._validate_input_format(self._tail, self._scanner.delimiters)
+        pending = self._pending_totals()
+        totals = self._calculator._new_totals()
+        totals.total = self._totals.total + pending.total
+        totals.add_negatives(self._totals.negatives, self._totals.omitted)
+        totals.add_negatives(pending.negatives)
+        return totals.result()
+    
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Capture the state so the sum can be resumed later with restore().
+        
+        Returns:
+            JSON-serialisable dictionary with the delimiter spec, running total,
+            negatives (and the count left out by the negative policy),
+            unfinished token and trailing-delimiter summary
+        """
+        return {
+            'delimiter_spec': self.delimiter_spec,
+            'total': self._totals.total,
+            'negatives': list(self._totals.negatives),
+            'omitted_negatives': self._totals.omitted,
+            'pending': self._pending,
+            'tail': self._tail
+        }
+    
+    def restore(self, snapshot: Dict[str, object]) -> None:
+        """
+        Resume from a snapshot() without re-parsing the text fed before it.
+        
+        Args:
+            snapshot: Dictionary returned by snapshot()
+            
+        Raises:
+            ValueError: If the snapshot was taken with a different delimiter spec
+        """
+        if snapshot['delimiter_spec'] != self.delimiter_spec:
+            raise ValueError("snapshot was taken with a different delimiter spec")
+        
+        self._totals = self._calculator._new_totals()
+        self._totals.total = snapshot['total']
+        self._totals.negatives = list(snapshot['negatives'])
+        self._totals.omitted = snapshot['omitted_negatives']
+        self._pending = snapshot['pending']
+        self._tail = snapshot['tail']
 
 
 class StringCalculator:
@@ -18,6 +1508,73 @@ class StringCalculator:
     9. Multiple longer-length delimiters
     """
     
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE,
+                 parallel_threshold: Optional[int] = None, max_workers: Optional[int] = None,
+                 backend: str = 'auto', result_cache_size: int = 0,
+                 result_cache_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
+                 max_numbers: Optional[int] = None, max_delimiters: Optional[int] = None,
+                 max_delimiter_length: Optional[int] = None, profiler: Optional[StageProfiler] = None,
+                 negative_policy: str = 'collect-all', max_negatives: int = DEFAULT_MAX_NEGATIVES):
+        """
+        Create a calculator.
+        
+        Args:
+            cache_size: Number of compiled custom delimiter specs to keep (0 disables caching)
+            parallel_threshold: Minimum length of the numbers section, in characters,
+                that add() sums in a process pool (None keeps add() on one core);
+                sections past it use the pool whatever the backend
+            max_workers: Number of worker processes (defaults to the CPU count)
+            backend: 'python', 'numpy' to parse every input with NumPy, or 'auto'
+                to use NumPy for sections of at least NUMPY_MIN_LENGTH characters.
+                Without NumPy installed every backend falls back to pure Python.
+            result_cache_size: Number of add() outcomes to remember for repeated
+                identical inputs (0, the default, disables result caching)
+            result_cache_bytes: Approximate memory limit of the result cache
+            max_numbers: Maximum number of numbers add() accepts in one input
+            max_delimiters: Maximum number of custom delimiters in one header
+            max_delimiter_length: Maximum length of a custom delimiter, in characters
+                (None, the default for all three limits, means unlimited)
+            profiler: StageProfiler, or any object with the same record() method,
+                that receives per-stage timings of every add() call that is not
+                answered from the result cache (None disables profiling)
+            negative_policy: 'collect-all' to report every negative, 'fail-fast'
+                to raise on the first negative without scanning the rest, or
+                'collect-up-to' to report the first max_negatives negatives
+                and count the others
+            max_negatives: Number of negatives reported by 'collect-up-to'
+        """
+        if parallel_threshold is not None and parallel_threshold < 0:
+            raise ValueError("parallel_threshold must be zero or a positive integer")
+        
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}, not {backend!r}")
+        
+        if negative_policy not in NEGATIVE_POLICIES:
+            raise ValueError(f"negative_policy must be one of {', '.join(NEGATIVE_POLICIES)}, not {negative_policy!r}")
+        
+        if max_negatives < 1:
+            raise ValueError("max_negatives must be a positive integer")
+        
+        for name, limit in (('max_numbers', max_numbers), ('max_delimiters', max_delimiters),
+                            ('max_delimiter_length', max_delimiter_length)):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} must be a positive integer or None")
+        
+        self._delimiter_cache = _DelimiterCache(cache_size)
+        self._result_cache = _ResultCache(result_cache_size, result_cache_bytes)
+        self._default_scanner = _NumberScanner(list(DEFAULT_DELIMITERS))
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backend = backend
+        self.max_numbers = max_numbers
+        self.max_delimiters = max_delimiters
+        self.max_delimiter_length = max_delimiter_length
+        self.profiler = profiler
+        self.negative_policy = negative_policy
+        self.max_negatives = max_negatives
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
     def add(self, numbers: str) -> int:
         """
         Add numbers from a string input.
@@ -29,173 +1586,561 @@ class StringCalculator:
             The sum of all numbers (ignoring numbers > 1000)
             
         Raises:
-            ValueError: If negative numbers are found or invalid format
+            ValueError: If the input format is invalid
+            NegativeNumbersError: If negative numbers are found (a ValueError)
+            InputTooLargeError: If the input exceeds a configured size limit
         """
+        if not numbers or self._result_cache.maxsize == 0:
+            return self._add(numbers)
+        
+        # Repeated inputs reuse the stored sum or error
+        succeeded, value = self._result_cache.get(numbers, self._add)
+        if not succeeded:
+            # A fresh copy per raise, so concurrent callers never share its
+            # traceback and the stored error never keeps a caller's context
+            raise copy.copy(value)
+        
+        return value
+    
+    def _add(self, numbers: str) -> int:
+        """Add numbers from a string input without consulting the result cache."""
+        if self.profiler is not None:
+            return self._add_profiled(numbers)
+        
         if not numbers or not numbers.strip():
             return 0
         
-        # Extract custom delimiters and numbers
-        delimiters, numbers_part = self._extract_custom_delimiters(numbers)
+        # Look up the compiled scanner for the delimiter spec
+        delimiter_spec, numbers_part = self._split_delimiter_header(numbers)
+        scanner = self._get_scanner(delimiter_spec)
         
         # Validate input format (no trailing delimiters)
-        self._validate_input_format(numbers_part, delimiters)
+        self._validate_input_format(numbers_part, scanner.delimiters)
+        
+        return self._sum_section(numbers_part, scanner, self._new_totals())
+    
+    def _add_profiled(self, numbers: str) -> int:
+        """
+        Add numbers like _add, timing each stage and passing the profile to the profiler.
+        
+        The stages are 'delimiters' (header split and scanner lookup),
+        'validate' (_validate_input_format) and 'sum' (parsing, negative checks
+        and summing, which the single-pass scanner does together). A stage that
+        raises and the stages after it are not recorded; 'total' always is.
+        The token count comes from the scan itself, so profiling does not add
+        a second pass over the input.
+        """
+        clock = time.perf_counter
+        stages = {}
+        numbers_part = None
+        scanner = None
+        totals = self._new_totals()
+        error = True
+        started = clock()
+        try:
+            if not numbers or not numbers.strip():
+                error = False
+                return 0
+            
+            delimiter_spec, numbers_part = self._split_delimiter_header(numbers)
+            scanner = self._get_scanner(delimiter_spec)
+            validating = clock()
+            stages['delimiters'] = validating - started
+            
+            self._validate_input_format(numbers_part, scanner.delimiters)
+            summing = clock()
+            stages['validate'] = summing - validating
+            
+            total = self._sum_section(numbers_part, scanner, totals)
+            stages['sum'] = clock() - summing
+            error = False
+            return total
+        finally:
+            stages['total'] = clock() - started
+            tokens = totals.tokens
+            if tokens is None:
+                # Paths that raised or ran in the process pool did not count the
+                # tokens; counting after the clock stops does not skew the timings
+                tokens = scanner.count_tokens(numbers_part) if scanner is not None else 0
+            nbytes = len(numbers) if not numbers or numbers.isascii() else len(numbers.encode('utf-8', 'surrogatepass'))
+            self.profiler.record(stages, tokens, nbytes, error)
+    
+    def _sum_section(self, numbers_part: str, scanner: _NumberScanner, totals: _ScanTotals) -> int:
+        """Sum a validated numbers section into empty totals on the fastest path available for it."""
+        # Inputs that may hold too many numbers are counted while scanning,
+        # so the scan stops as soon as the limit is passed
+        if self.max_numbers is not None and scanner.number_bound(numbers_part) > self.max_numbers:
+            return scanner.scan(numbers_part, self.max_numbers, totals)
         
-        # Parse numbers using the delimiters
-        number_list = self._parse_numbers(numbers_part, delimiters)
+        # Very large inputs are split across worker processes, whatever the backend
+        if self.parallel_threshold is not None and len(numbers_part) >= self.parallel_threshold:
+            return self._add_parallel(numbers_part, scanner)
         
-        # Validate for negative numbers
-        self._validate_negative_numbers(number_list)
+        # Large inputs are parsed with NumPy when it is installed
+        if self.backend == 'numpy' or (self.backend == 'auto' and len(numbers_part) >= NUMPY_MIN_LENGTH):
+            numpy_summer = scanner.for_numpy()
+            if numpy_summer is not None:
+                total = numpy_summer.sum(numbers_part, totals)
+                if total is not None:
+                    return total
         
-        # Filter out numbers > 1000 and sum
-        filtered_numbers = [num for num in number_list if num <= 1000]
-        return sum(filtered_numbers)
+        # Parse, validate and sum the numbers in a single pass
+        return scanner.scan(numbers_part, totals=totals)
+    
+    def _new_totals(self) -> _ScanTotals:
+        """Create empty scan totals that apply the negative policy."""
+        if self.negative_policy == 'collect-all':
+            return _ScanTotals()
+        if self.negative_policy == 'fail-fast':
+            return _ScanTotals(fail_fast=True)
+        return _ScanTotals(max_negatives=self.max_negatives)
     
-    def _extract_custom_delimiters(self, numbers: str) -> tuple[List[str], str]:
+    def add_many(self, inputs: List[str], on_error: str = 'raise') -> List[Union[int, ValueError]]:
         """
-        Extract custom delimiters from the input string.
+        Add numbers for many inputs at once.
+        
+        Inputs are grouped by delimiter spec so each compiled scanner is looked
+        up once per group, and clean inputs in a group are summed together.
+        Other inputs go through add() individually.
         
         Args:
-            numbers: Input string that may contain custom delimiter specification
+            inputs: Strings in the same format accepted by add()
+            on_error: 'raise' to raise the error of the first failing input,
+                or 'collect' to put the ValueError in that input's position
             
         Returns:
-            Tuple of (delimiters_list, numbers_string)
+            Results in input order (ints, plus ValueError instances with 'collect')
+            
+        Raises:
+            ValueError: If on_error is 'raise' and any input is invalid
         """
-        # Default delimiters include comma, newline, and tab
-        delimiters = [',', '\n', '\t']
+        if on_error not in ('raise', 'collect'):
+            raise ValueError(f"on_error must be 'raise' or 'collect', not {on_error!r}")
         
-        # Check if custom delimiters are specified
-        if numbers.startswith('//'):
-            # Find the end of delimiter specification
-            newline_pos = numbers.find('\n')
-            if newline_pos == -1:
-                raise ValueError("Invalid custom delimiter format")
+        results = [None] * len(inputs)
+        pending = []
+        
+        # Clean sections of a group are converted with NumPy like add() would
+        if np is None or self.backend == 'python':
+            numpy_min_length = None
+        else:
+            numpy_min_length = 0 if self.backend == 'numpy' else NUMPY_MIN_LENGTH
+        
+        # Inputs without a header form the default group
+        has_header = list(map(str.startswith, inputs, itertools.repeat('//')))
+        default_indexes = list(itertools.compress(range(len(inputs)), map(operator.not_, has_header)))
+        groups = {None: (default_indexes, list(map(inputs.__getitem__, default_indexes)))}
+        
+        # Group the rest by their raw header ('//' plus delimiter spec)
+        header_indexes = list(itertools.compress(range(len(inputs)), has_header))
+        split_inputs = map(str.partition, map(inputs.__getitem__, header_indexes), itertools.repeat('\n'))
+        for index, (header, newline, numbers) in zip(header_indexes, split_inputs):
+            if not newline:
+                pending.append(index)
+                continue
+            
+            group = groups.get(header)
+            if group is None:
+                group = groups[header] = ([], [])
+            group[0].append(index)
+            group[1].append(numbers)
+        
+        for header, (indexes, sections) in groups.items():
+            try:
+                summer = self._get_scanner(header and header[2:]).for_batches()
+            except InputTooLargeError:
+                summer = None
+            if summer is None:
+                pending.extend(indexes)
+                continue
+            
+            for index, total in zip(indexes, summer.sum_all(sections, self.max_numbers, numpy_min_length)):
+                if total is None:
+                    pending.append(index)
+                else:
+                    results[index] = total
+        
+        # Everything else takes the full path, in input order so 'raise'
+        # reports the first failing input
+        for index in sorted(pending):
+            try:
+                results[index] = self.add(inputs[index])
+            except ValueError as e:
+                if on_error == 'raise':
+                    raise
+                results[index] = e
+        
+        return results
+    
+    def add_stream(self, source: Union[Iterable, str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Add numbers read incrementally from a file-like object or iterable of chunks.
+        
+        The custom delimiter header is read once, then numbers are parsed chunk
+        by chunk, carrying delimiters and digit runs that are split between
+        chunks over to the next one. Only the running sum, the negatives and
+        the unfinished token are kept, so memory stays flat for any input size.
+        
+        Args:
+            source: File-like object with read(), or an iterable of str/bytes chunks
+            chunk_size: Number of characters or bytes to request per read() call
             
-            # Extract delimiter specification
-            delimiter_spec = numbers[2:newline_pos]
-            numbers_part = numbers[newline_pos + 1:]
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000), same as add()
             
-            # Parse custom delimiters
-            custom_delimiters = self._parse_custom_delimiters(delimiter_spec)
-            delimiters = custom_delimiters
+        Raises:
+            ValueError: If negative numbers are found or invalid format, same as add()
+            InputTooLargeError: If the custom delimiter header is longer than the
+                delimiter limits allow (MAX_STREAM_HEADER_LENGTH without limits)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        
+        # The header is buffered until its newline arrives, so its length is capped
+        if self.max_delimiters is not None and self.max_delimiter_length is not None:
+            header_limit = self.max_delimiters * (self.max_delimiter_length + 2)
         else:
-            numbers_part = numbers
+            header_limit = MAX_STREAM_HEADER_LENGTH
+        
+        chunks = _iter_text_chunks(source, chunk_size)
+        
+        # Read just enough input to tell whether there is a custom delimiter header
+        head = ''
+        for chunk in chunks:
+            head += chunk
+            if head.startswith('//'):
+                if '\n' in chunk:
+                    break
+                if len(head) - 2 > header_limit:
+                    raise InputTooLargeError(
+                        f"Input too large: custom delimiter header longer than {header_limit} characters"
+                    )
+            elif len(head) >= 2 or not '//'.startswith(head):
+                break
+        
+        delimiter_spec, numbers_part = self._split_delimiter_header(head)
+        scanner = self._get_scanner(delimiter_spec)
+        totals = self._new_totals()
+        tail = ''
+        carry = ''
+        error = None
+        
+        for text in itertools.chain((numbers_part,), chunks):
+            tail = _compress_tail(tail, text)
+            if error is not None:
+                # Keep reading so a trailing delimiter error still takes precedence
+                continue
+            
+            text = carry + text if carry else text
+            try:
+                carry = text[scanner.feed(text, totals, final=False):]
+            except ValueError as e:
+                error = e
         
-        return delimiters, numbers_part
+        if error is None:
+            try:
+                scanner.feed(carry, totals)
+            except ValueError as e:
+                error = e
+        
+        # Validate input format (no trailing delimiters) before reporting parse errors
+        self._validate_input_format(tail, scanner.delimiters)
+        
+        if error is not None:
+            raise error
+        
+        return totals.result()
     
-    def _parse_custom_delimiters(self, delimiter_spec: str) -> List[str]:
+    def accumulator(self, delimiter_spec: Optional[str] = None) -> Accumulator:
         """
-        Parse custom delimiter specification.
+        Create an accumulator that sums a numbers section fed in pieces.
+        
+        Use it instead of calling add() on a string that keeps growing: every
+        feed() only scans the appended text.
         
         Args:
-            delimiter_spec: String containing delimiter specification
+            delimiter_spec: Raw text between '//' and the newline of a custom
+                delimiter header, or None for the default delimiters
             
         Returns:
-            List of delimiter strings
+            An empty accumulator for the delimiters
         """
-        delimiters = []
+        return Accumulator(self, delimiter_spec)
+    
+    def add_file(self, path: Union[str, os.PathLike]) -> int:
+        """
+        Add numbers from a file by parsing its memory-mapped bytes.
         
-        # Handle multiple delimiters in brackets [delim1][delim2]
-        pattern = r'\[([^\]]+)\]'
-        matches = re.findall(pattern, delimiter_spec)
+        The file is never read into a str, so memory use does not grow with
+        the file size beyond the pages the operating system maps in.
         
-        if matches:
-            # Multiple delimiters specified
-            delimiters.extend(matches)
-        else:
-            # Single delimiter specified
-            delimiters.append(delimiter_spec)
+        Args:
+            path: Path to a UTF-8 text file in the calculator input format
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000), same as add()
+            
+        Raises:
+            ValueError: If negative numbers are found or invalid format, same as add()
+        """
+        with open(path, 'rb') as f:
+            # Empty files cannot be memory-mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                if hasattr(buf, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    buf.madvise(mmap.MADV_SEQUENTIAL)
+                return self._add_buffer(buf)
+    
+    def add_bytes(self, buf) -> int:
+        """
+        Add numbers from a UTF-8 encoded buffer without decoding it to a str.
         
-        return delimiters
+        Any object supporting the buffer protocol is accepted, e.g. bytes,
+        bytearray, mmap or a slice of a memoryview. Memoryviews are scanned in
+        place, so the tokens are views into the caller's memory rather than
+        copies; only a non-contiguous view is copied first.
+        
+        Args:
+            buf: UTF-8 encoded input in the calculator input format
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000), same as add()
+            
+        Raises:
+            ValueError: If the input format is invalid, same as add()
+            NegativeNumbersError: If negative numbers are found (a ValueError)
+            InputTooLargeError: If the input exceeds a configured size limit
+        """
+        if not isinstance(buf, (bytes, mmap.mmap)):
+            buf = memoryview(buf)
+            if not buf.c_contiguous:
+                # Regular expressions can only search contiguous memory
+                buf = buf.tobytes()
+            elif buf.format != 'B' or buf.ndim != 1:
+                buf = buf.cast('B')
+        
+        return self._add_buffer(buf, self.max_numbers)
     
-    def _validate_input_format(self, numbers: str, delimiters: List[str]) -> None:
+    def _add_buffer(self, buf, max_numbers: Optional[int] = None) -> int:
         """
-        Validate that the input format is correct (no trailing delimiters).
+        Add numbers from a UTF-8 encoded buffer without decoding it.
         
         Args:
-            numbers: String containing numbers
-            delimiters: List of delimiter strings
+            buf: bytes, mmap or a one-dimensional memoryview of bytes
+            max_numbers: Maximum number of numbers to accept (None for no limit)
+            
+        Returns:
+            The sum of all numbers (ignoring numbers > 1000)
             
         Raises:
-            ValueError: If input format is invalid
+            ValueError: If negative numbers are found or invalid format
         """
-        if not numbers or not numbers.strip():
-            return
+        # Split off the custom delimiter header
+        start = 0
+        delimiter_spec = None
+        if buf[:2] == b'//':
+            newline = _NEWLINE.search(buf)
+            if newline is None:
+                raise ValueError("Invalid custom delimiter format")
+            delimiter_spec = bytes(buf[2:newline.start()]).decode('utf-8')
+            start = newline.end()
         
-        # Check for trailing delimiters - only validate if there are actual numbers
-        # This allows cases like "1,2\n" (newline at end) but catches "1,\n" (comma followed by newline)
-        if numbers.strip():
-            # Check for specific invalid patterns like "1,\n" (comma followed by newline)
-            for delimiter in delimiters:
-                if delimiter == ',':
-                    # Check for comma followed by newline pattern
-                    if re.search(r',\s*\n\s*$', numbers):
-                        raise ValueError("Invalid input: trailing delimiter ',' not allowed")
-                elif delimiter == '\n':
-                    # Allow newline at end, but check for comma before newline
-                    if re.search(r',\s*\n\s*$', numbers):
-                        raise ValueError("Invalid input: trailing delimiter ',' not allowed")
+        scanner = self._get_scanner(delimiter_spec)
+        bytes_scanner = scanner.for_bytes()
+        if bytes_scanner is None:
+            # The empty delimiter splits between characters, so decode instead
+            return self.add(bytes(buf).decode('utf-8'))
+        
+        # Validate input format (no trailing delimiters)
+        self._validate_input_format(_buffer_tail(buf, start), scanner.delimiters)
+        
+        # Parse, validate and sum the numbers in a single pass over the buffer
+        totals = self._new_totals()
+        return bytes_scanner.scan(buf, max_numbers, totals, pos=start)
+    
+    def close(self) -> None:
+        """Shut down the worker processes used for parallel summation, if any."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        
+        if executor is not None:
+            executor.shutdown()
     
-    def _parse_numbers(self, numbers: str, delimiters: List[str]) -> List[int]:
+    def _add_parallel(self, numbers: str, scanner: _NumberScanner) -> int:
         """
-        Parse numbers from string using specified delimiters.
+        Sum the numbers section in a process pool.
+        
+        The section is cut at token boundaries, each piece is scanned in a
+        worker, and partial sums and negatives are merged in input order so
+        errors are identical to the serial scan.
         
         Args:
-            numbers: String containing numbers
-            delimiters: List of delimiter strings
+            numbers: String containing numbers (without the custom delimiter header)
+            scanner: Scanner for the input's delimiters
             
         Returns:
-            List of parsed integers
+            The sum of all numbers (ignoring numbers > 1000)
             
         Raises:
-            ValueError: If any non-integer numbers are found
+            ValueError: If negative numbers are found or invalid format
         """
-        if not numbers or not numbers.strip():
-            return []
+        boundaries = scanner.chunk_boundaries(numbers, self.max_workers)
+        delimiters = tuple(scanner.delimiters)
+        executor = self._get_executor()
         
-        # Create regex pattern for all delimiters
-        # Escape special regex characters in delimiters
-        escaped_delimiters = [re.escape(delim) for delim in delimiters]
-        pattern = '|'.join(escaped_delimiters)
+        totals = self._new_totals()
+        futures = [
+            executor.submit(_scan_chunk, delimiters, numbers[start:end], totals.fail_fast, totals.max_negatives)
+            for start, end in zip(boundaries, boundaries[1:])
+            if end > start
+        ]
         
-        # Split by delimiters and convert to integers
-        number_strings = re.split(pattern, numbers)
+        # Results are collected in input order, so the first invalid token
+        # and the order of negatives match the serial scan
+        for future in futures:
+            total, negatives, omitted = future.result()
+            totals.total += total
+            totals.add_negatives(negatives, omitted)
         
-        # Filter out empty strings and validate each number
-        number_list = []
-        for num_str in number_strings:
-            if num_str.strip():  # Skip empty strings
-                stripped_num = num_str.strip()
-                
-                # Check if the number contains decimal point
-                if '.' in stripped_num:
-                    raise ValueError(f"Invalid input: decimal numbers not allowed: {stripped_num}")
-                
-                # Check if the number contains any non-digit characters (except minus sign at start)
-                if not re.match(r'^-?\d+$', stripped_num):
-                    raise ValueError(f"Invalid input: non-integer number not allowed: {stripped_num}")
-                
-                try:
-                    number_list.append(int(stripped_num))
-                except ValueError as e:
-                    raise ValueError(f"Invalid input: cannot convert to integer: {stripped_num}")
+        return totals.result()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+    
+    def delimiter_cache_info(self) -> Dict[str, int]:
+        """
+        Get statistics for the compiled delimiter cache.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, maxsize and currsize
+        """
+        return self._delimiter_cache.info()
+    
+    def clear_delimiter_cache(self) -> None:
+        """Empty the compiled delimiter cache and reset its statistics."""
+        self._delimiter_cache.clear()
+    
+    def result_cache_info(self) -> Dict[str, int]:
+        """
+        Get statistics for the add() result cache.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, maxsize, currsize, maxbytes and currbytes
+        """
+        return self._result_cache.info()
+    
+    def clear_result_cache(self) -> None:
+        """Empty the add() result cache and reset its statistics."""
+        self._result_cache.clear()
+    
+    def _get_scanner(self, delimiter_spec: Optional[str]) -> _NumberScanner:
+        """
+        Get a compiled scanner for a delimiter specification.
+        
+        Args:
+            delimiter_spec: Raw text between '//' and the first newline, or None for defaults
+            
+        Returns:
+            Scanner for the delimiters described by the specification
+        """
+        if delimiter_spec is None:
+            return self._default_scanner
+        
+        return self._delimiter_cache.get(delimiter_spec, self._compile_scanner)
+    
+    def _compile_scanner(self, delimiter_spec: str) -> _NumberScanner:
+        """Build a scanner for a raw custom delimiter specification."""
+        return _NumberScanner(self._parse_custom_delimiters(delimiter_spec))
+    
+    def _split_delimiter_header(self, numbers: str) -> tuple[Optional[str], str]:
+        """
+        Split the custom delimiter header from the numbers.
+        
+        Args:
+            numbers: Input string that may contain custom delimiter specification
+            
+        Returns:
+            Tuple of (delimiter_spec or None, numbers_string)
+            
+        Raises:
+            ValueError: If the header is not terminated by a newline
+        """
+        if not numbers.startswith('//'):
+            return None, numbers
         
-        return number_list
+        # Find the end of delimiter specification
+        newline_pos = numbers.find('\n')
+        if newline_pos == -1:
+            raise ValueError("Invalid custom delimiter format")
+        
+        return numbers[2:newline_pos], numbers[newline_pos + 1:]
+    
+    def _parse_custom_delimiters(self, delimiter_spec: str) -> List[str]:
+        """
+        Parse custom delimiter specification.
+        
+        Args:
+            delimiter_spec: String containing delimiter specification
+            
+        Returns:
+            List of delimiter strings
+            
+        Raises:
+            InputTooLargeError: If there are more than max_delimiters delimiters
+                or one is longer than max_delimiter_length
+        """
+        delimiters = []
+        
+        # Handle multiple delimiters in brackets [delim1][delim2]
+        pattern = r'\[([^\]]+)\]'
+        for match in re.finditer(pattern, delimiter_spec):
+            # Limits are checked as each delimiter is found so huge headers stop early
+            if self.max_delimiters is not None and len(delimiters) == self.max_delimiters:
+                raise InputTooLargeError(f"Input too large: more than {self.max_delimiters} custom delimiters")
+            self._check_delimiter_length(match.group(1))
+            delimiters.append(match.group(1))
+        
+        if not delimiters:
+            # Single delimiter specified
+            self._check_delimiter_length(delimiter_spec)
+            delimiters.append(delimiter_spec)
+        
+        return delimiters
+    
+    def _check_delimiter_length(self, delimiter: str) -> None:
+        """Raise InputTooLargeError if a custom delimiter is longer than max_delimiter_length."""
+        if self.max_delimiter_length is not None and len(delimiter) > self.max_delimiter_length:
+            raise InputTooLargeError(
+                f"Input too large: custom delimiter longer than {self.max_delimiter_length} characters"
+            )
     
-    def _validate_negative_numbers(self, numbers: List[int]) -> None:
+    def _validate_input_format(self, numbers: str, delimiters: List[str]) -> None:
         """
-        Validate that no negative numbers are present.
+        Validate that the input format is correct (no trailing delimiters).
         
         Args:
-            numbers: List of numbers to validate
+            numbers: String containing numbers
+            delimiters: List of delimiter strings
             
         Raises:
-            ValueError: If any negative numbers are found
+            ValueError: If input format is invalid
         """
-        negative_numbers = [num for num in numbers if num < 0]
+        if not numbers:
+            return
         
-        if negative_numbers:
-            error_message = f"negative numbers not allowed: {' '.join(map(str, negative_numbers))}"
-            raise ValueError(error_message)
+        # Check for trailing delimiters - only validate if there are actual numbers
+        # This allows cases like "1,2\n" (newline at end) but catches "1,\n" (comma followed by newline)
+        if ',' in delimiters or '\n' in delimiters:
+            # Only the end of the input is examined, so the check takes time
+            # proportional to the trailing whitespace, not to the input
+            if _ends_with_comma_line(numbers):
+                raise ValueError("Invalid input: trailing delimiter ',' not allowed")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,108 @@
+"""
+Staged reference implementation of StringCalculator.add() for the tests.
+add() used to extract the delimiters, parse every token and check for negatives
+as separate steps; the single-pass scanner must give the same results and errors.
+"""
+import re
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import DEFAULT_DELIMITERS, MAX_NUMBER, _DelimiterTrie
+
+# Pattern a stripped token must fully match to be parsed as an integer
+INTEGER = re.compile(r'-?\d+')
+
+
+def extract_custom_delimiters(calculator, numbers):
+    """
+    Extract custom delimiters from the input string.
+    
+    Args:
+        calculator: StringCalculator whose delimiter limits apply
+        numbers: Input string that may contain custom delimiter specification
+    
+    Returns:
+        Tuple of (delimiters_list, numbers_string)
+    """
+    delimiter_spec, numbers_part = calculator._split_delimiter_header(numbers)
+    
+    # Default delimiters include comma, newline, and tab
+    if delimiter_spec is None:
+        return list(DEFAULT_DELIMITERS), numbers_part
+    
+    # Parse custom delimiters
+    return calculator._parse_custom_delimiters(delimiter_spec), numbers_part
+
+
+def parse_numbers(numbers, delimiters):
+    """
+    Parse numbers from string using specified delimiters.
+    
+    Args:
+        numbers: String containing numbers
+        delimiters: List of delimiter strings
+    
+    Returns:
+        List of parsed integers
+    
+    Raises:
+        ValueError: If any non-integer numbers are found
+    """
+    if not numbers or not numbers.strip():
+        return []
+    
+    # Create regex pattern for all delimiters (longest match wins)
+    pattern = _DelimiterTrie(delimiters).pattern()
+    
+    # Split by delimiters and convert to integers
+    number_strings = re.split(pattern, numbers)
+    
+    # Filter out empty strings and validate each number
+    number_list = []
+    for num_str in number_strings:
+        stripped_num = num_str.strip()
+        if not stripped_num:  # Skip empty strings
+            continue
+        
+        # Check if the number contains decimal point
+        if '.' in stripped_num:
+            raise ValueError(f"Invalid input: decimal numbers not allowed: {stripped_num}")
+        
+        # Check if the number contains any non-digit characters (except minus sign at start)
+        if not INTEGER.fullmatch(stripped_num):
+            raise ValueError(f"Invalid input: non-integer number not allowed: {stripped_num}")
+        
+        try:
+            number_list.append(int(stripped_num))
+        except ValueError:
+            raise ValueError(f"Invalid input: cannot convert to integer: {stripped_num}")
+    
+    return number_list
+
+
+def validate_negative_numbers(calculator, numbers):
+    """
+    Validate that no negative numbers are present.
+    
+    Args:
+        calculator: StringCalculator whose negative policy applies
+        numbers: List of numbers to validate
+    
+    Raises:
+        NegativeNumbersError: If any negative numbers are found
+    """
+    totals = calculator._new_totals()
+    totals.add_negatives([num for num in numbers if num < 0])
+    totals.result()
+
+
+def staged_add(calculator, numbers):
+    """Compute the result of add() with the staged extract/validate/parse/check steps."""
+    delimiters, numbers_part = extract_custom_delimiters(calculator, numbers)
+    calculator._validate_input_format(numbers_part, delimiters)
+    number_list = parse_numbers(numbers_part, delimiters)
+    validate_negative_numbers(calculator, number_list)
+    return sum(num for num in number_list if num <= MAX_NUMBER)
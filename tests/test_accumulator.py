@@ -0,0 +1,116 @@
+"""
+Test cases for the incremental accumulator.
+These tests check that feeding a numbers section in pieces matches add() on the whole section.
+"""
+import unittest
+import sys
+import os
+import json
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StringCalculator
+
+
+class TestAccumulator(unittest.TestCase):
+    """Test cases for StringCalculator.accumulator()."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+    
+    def feed_in_pieces(self, numbers, size, delimiter_spec=None):
+        """Feed a numbers section in pieces of the given size and return the accumulator."""
+        accumulator = self.calculator.accumulator(delimiter_spec)
+        for start in range(0, len(numbers), size):
+            accumulator.feed(numbers[start:start + size])
+        return accumulator
+    
+    def test_empty_accumulator(self):
+        """Test that nothing fed sums to zero."""
+        accumulator = self.calculator.accumulator()
+        self.assertEqual((accumulator.total, accumulator.negatives, accumulator.result()), (0, [], 0))
+    
+    def test_matches_add_for_every_piece_size(self):
+        """Test that tokens and delimiters split between feeds are carried over."""
+        cases = [(None, "1,22\n333\t4,1001,1000"), (";", "10;20;30"), ("[***][*]", "1***2*3***40"), ("", "123")]
+        for delimiter_spec, numbers in cases:
+            header = "" if delimiter_spec is None else f"//{delimiter_spec}\n"
+            expected = self.calculator.add(header + numbers)
+            for size in range(1, 5):
+                accumulator = self.feed_in_pieces(numbers, size, delimiter_spec)
+                self.assertEqual(accumulator.result(), expected, (numbers, size))
+                self.assertEqual(accumulator.total, expected, (numbers, size))
+    
+    def test_total_as_if_input_ended(self):
+        """Test that the unfinished last token counts towards the total until it grows."""
+        accumulator = self.calculator.accumulator()
+        accumulator.feed("1,10")
+        self.assertEqual(accumulator.total, 11)
+        accumulator.feed("0")
+        self.assertEqual(accumulator.total, 101)
+        accumulator.feed("1")
+        self.assertEqual(accumulator.total, 1)
+    
+    def test_negatives(self):
+        """Test that negatives are collected in order and reported by result()."""
+        accumulator = self.feed_in_pieces("-1,2,-3", 2)
+        self.assertEqual((accumulator.total, accumulator.negatives), (2, [-1, -3]))
+        
+        with self.assertRaises(ValueError) as context:
+            accumulator.result()
+        
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -1 -3")
+    
+    def test_trailing_delimiter(self):
+        """Test that result() applies the trailing delimiter check of add()."""
+        accumulator = self.feed_in_pieces("1,2,\n", 1)
+        with self.assertRaises(ValueError) as context:
+            accumulator.result()
+        
+        self.assertEqual(str(context.exception), "Invalid input: trailing delimiter ',' not allowed")
+    
+    def test_invalid_token_leaves_state_unchanged(self):
+        """Test that a feed with an invalid completed token is not consumed."""
+        accumulator = self.calculator.accumulator()
+        accumulator.feed("1,-2,")
+        
+        with self.assertRaises(ValueError):
+            accumulator.feed("-3,x,4")
+        
+        self.assertEqual((accumulator.total, accumulator.negatives), (1, [-2]))
+        accumulator.feed("5")
+        self.assertEqual(accumulator.total, 6)
+    
+    def test_snapshot_and_restore(self):
+        """Test that a JSON round-tripped snapshot resumes without the earlier text."""
+        accumulator = self.calculator.accumulator(";")
+        accumulator.feed("1;-2;3")
+        snapshot = json.loads(json.dumps(accumulator.snapshot()))
+        
+        resumed = self.calculator.accumulator(";")
+        resumed.restore(snapshot)
+        resumed.feed("0;4")
+        accumulator.feed("0;4")
+        
+        self.assertEqual((resumed.total, resumed.negatives), (35, [-2]))
+        self.assertEqual(resumed.snapshot(), accumulator.snapshot())
+    
+    def test_restore_with_other_delimiters_rejected(self):
+        """Test that a snapshot cannot be restored with a different delimiter spec."""
+        snapshot = self.calculator.accumulator(";").snapshot()
+        with self.assertRaises(ValueError):
+            self.calculator.accumulator().restore(snapshot)
+    
+    def test_long_ledger(self):
+        """Test that a ledger fed one number at a time is summed correctly."""
+        accumulator = self.calculator.accumulator()
+        for i in range(100000):
+            accumulator.feed(f"{i % 1500},")
+        
+        self.assertEqual(accumulator.total, sum(i % 1500 for i in range(100000) if i % 1500 <= 1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
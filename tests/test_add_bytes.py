@@ -0,0 +1,117 @@
+"""
+Test cases for adding numbers from buffers.
+These tests check that add_bytes() matches add() for every kind of buffer.
+"""
+import unittest
+import sys
+import os
+from array import array
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import InputTooLargeError, NegativeNumbersError, StringCalculator
+
+
+class TestAddBytes(unittest.TestCase):
+    """Test cases for add_bytes()."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+    
+    def outcome(self, func, *args):
+        """Return ('result', value) or ('error', message) for a call."""
+        try:
+            return ('result', func(*args))
+        except ValueError as e:
+            return ('error', str(e))
+    
+    def buffers(self, numbers):
+        """Get the UTF-8 encoding of numbers as each kind of buffer."""
+        data = numbers.encode('utf-8')
+        padded = b'[' + data + b']'
+        return [
+            data,
+            bytearray(data),
+            memoryview(data),
+            memoryview(padded)[1:-1],
+            memoryview(bytearray(padded))[1:-1],
+            array('B', data),
+        ]
+    
+    def assertMatchesAdd(self, numbers):
+        """Assert that every buffer of numbers gives the same result or error as add()."""
+        expected = self.outcome(self.calculator.add, numbers)
+        for buf in self.buffers(numbers):
+            self.assertEqual(self.outcome(self.calculator.add_bytes, buf), expected, (numbers, type(buf)))
+    
+    def test_empty_and_whitespace(self):
+        """Test that empty and whitespace-only buffers return 0."""
+        for numbers in ["", " ", "\n", " \t "]:
+            self.assertMatchesAdd(numbers)
+    
+    def test_default_and_custom_delimiters(self):
+        """Test default, single, multi-character, digit and non-ASCII delimiters."""
+        for numbers in ["1,2\n3\t4", "1,,2", "1001,2", "007,1", "//;\n1;2;3", "//[***][%]\n1***2%3",
+                        "//[*][**]\n1**2*3", "//1\n213", "//[é]\n1é2", "//\n123", "//[,][,-]\n1,-2"]:
+            self.assertMatchesAdd(numbers)
+    
+    def test_errors_match_add(self):
+        """Test that format errors and negatives give the same messages as add()."""
+        for numbers in ["1,-2,3,-4", "1,2.5", "1,abc", "1,\n", "1, \n", "//;1;2", "1,١,2", "1,--2",
+                        "1, 2", "99999999999999999999,1"]:
+            self.assertMatchesAdd(numbers)
+    
+    def test_negative_error_type(self):
+        """Test that negatives raise NegativeNumbersError with the negatives listed."""
+        with self.assertRaises(NegativeNumbersError) as context:
+            self.calculator.add_bytes(memoryview(b"1,-2,3,-4"))
+        self.assertEqual(list(context.exception.negatives), [-2, -4])
+    
+    def test_slice_of_larger_buffer(self):
+        """Test that a memoryview slice only reads its own bytes."""
+        data = bytearray(b"-1,5,6,-1")
+        self.assertEqual(self.calculator.add_bytes(memoryview(data)[3:6]), 11)
+    
+    def test_non_byte_formats(self):
+        """Test that views with other item formats or strides are read as raw bytes."""
+        self.assertEqual(self.calculator.add_bytes(memoryview(b"1,2,3").cast('c')), 6)
+        self.assertEqual(self.calculator.add_bytes(memoryview(b"1,2,3")[::2]), 123)
+    
+    def test_large_buffer(self):
+        """Test that a large buffer is summed correctly."""
+        numbers = ",".join(str(i % 2000) for i in range(50000))
+        self.assertMatchesAdd(numbers)
+        self.assertMatchesAdd(numbers + ",x")
+    
+    def test_large_buffer_max_numbers(self):
+        """Test that max_numbers counts numbers across the whole of a large buffer."""
+        calculator = StringCalculator(max_numbers=50000)
+        numbers = ",".join(str(i % 2000) for i in range(50000))
+        self.assertEqual(calculator.add_bytes(numbers.encode()), calculator.add(numbers))
+        with self.assertRaises(InputTooLargeError):
+            calculator.add_bytes((numbers + ",1").encode())
+    
+    def test_max_numbers(self):
+        """Test that add_bytes() applies the max_numbers limit like add()."""
+        calculator = StringCalculator(max_numbers=3)
+        self.assertEqual(calculator.add_bytes(b"1,2,3"), 6)
+        with self.assertRaises(InputTooLargeError):
+            calculator.add_bytes(memoryview(b"1,2,3,4"))
+    
+    def test_negative_policy(self):
+        """Test that add_bytes() reports negatives by the calculator's policy."""
+        calculator = StringCalculator(negative_policy='fail-fast')
+        with self.assertRaises(NegativeNumbersError) as context:
+            calculator.add_bytes(memoryview(b"1,-2,-3"))
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -2")
+    
+    def test_rejects_objects_without_buffer(self):
+        """Test that objects not supporting the buffer protocol raise TypeError."""
+        with self.assertRaises(TypeError):
+            self.calculator.add_bytes("1,2")
+
+
+if __name__ == '__main__':
+    unittest.main()
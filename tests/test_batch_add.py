@@ -0,0 +1,120 @@
+"""
+Test cases for batch addition with add_many().
+These tests cover grouping by delimiter spec, ordering and error handling.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StringCalculator
+
+
+class TestBatchAdd(unittest.TestCase):
+    """Test cases for batch addition."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+    
+    def expected(self, inputs):
+        """Compute the expected 'collect' results with a loop over add()."""
+        results = []
+        for numbers in inputs:
+            try:
+                results.append(('result', self.calculator.add(numbers)))
+            except ValueError as e:
+                results.append(('error', str(e)))
+        return results
+    
+    def collected(self, inputs):
+        """Run add_many() with 'collect' and normalise errors for comparison."""
+        return [
+            ('error', str(item)) if isinstance(item, ValueError) else ('result', item)
+            for item in self.calculator.add_many(inputs, on_error='collect')
+        ]
+    
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list."""
+        self.assertEqual(self.calculator.add_many([]), [])
+    
+    def test_results_in_input_order(self):
+        """Test that results follow input order across delimiter groups."""
+        inputs = ["1,2", "//;\n1;2;3", "4\n5", "//[***][%]\n1***2%3", "//;\n10;20", "1001,2"]
+        self.assertEqual(self.calculator.add_many(inputs), [3, 6, 9, 6, 30, 2])
+    
+    def test_matches_add_for_mixed_inputs(self):
+        """Test that every kind of input gives the same result as add()."""
+        inputs = ["", " ", "1", "1,,2", " 1 , 2 ", "1,2\n", "2000,1000", "//[a][ab]\n1ab2",
+                  "//[ab][a]\n1ab2", "//[*][**]\n1**2", "//1\n213", "//\n123", "1,\x002", "١,2"]
+        self.assertEqual(self.collected(inputs), self.expected(inputs))
+    
+    def test_collect_errors(self):
+        """Test that 'collect' puts each error at its input's position."""
+        results = self.calculator.add_many(["1,2", "1,-2", "1.5", "//;1;2", "3"], on_error='collect')
+        
+        self.assertEqual(results[0], 3)
+        self.assertEqual(str(results[1]), "negative numbers not allowed: -2")
+        self.assertEqual(str(results[2]), "Invalid input: decimal numbers not allowed: 1.5")
+        self.assertEqual(str(results[3]), "Invalid custom delimiter format")
+        self.assertEqual(results[4], 3)
+    
+    def test_digit_run_too_long_for_int(self):
+        """Test that a digit run over the int() limit is collected as that input's error."""
+        inputs = ["1,2", "1," + "9" * 5000, "//;\n3;4", "5,6"]
+        results = self.calculator.add_many(inputs, on_error='collect')
+        
+        self.assertEqual(results[0], 3)
+        self.assertEqual(str(results[1]), "Invalid input: cannot convert to integer: " + "9" * 5000)
+        self.assertEqual(results[2:], [7, 11])
+        self.assertEqual(self.collected(inputs), self.expected(inputs))
+    
+    def test_raise_reports_first_failing_input(self):
+        """Test that 'raise' raises the error of the earliest failing input."""
+        with self.assertRaises(ValueError) as context:
+            self.calculator.add_many(["//;\n1;2", "1,abc", "1,-2"])
+        
+        self.assertEqual(str(context.exception), "Invalid input: non-integer number not allowed: abc")
+    
+    def test_invalid_on_error(self):
+        """Test that an unknown on_error value is rejected."""
+        with self.assertRaises(ValueError):
+            self.calculator.add_many(["1"], on_error='ignore')
+    
+    def test_delimiter_spec_compiled_once_per_group(self):
+        """Test that each delimiter spec is looked up once per batch."""
+        self.calculator.add_many(["//;\n1;2"] * 50 + ["//[**]\n1**2"] * 50)
+        
+        self.assertEqual(self.calculator.delimiter_cache_info()['misses'], 2)
+        self.assertEqual(self.calculator.delimiter_cache_info()['hits'], 0)
+    
+    def test_padded_inputs_summed_together(self):
+        """Test that spaces around numbers do not send inputs to add() one by one."""
+        inputs = ["1, 2, 3", " 4 ,5 ", "//;\n6 ; 7", "8,  2000"]
+        for backend in ('python', 'numpy'):
+            calculator = StringCalculator(backend=backend)
+            calculator.add = None
+            self.assertEqual(calculator.add_many(inputs), [6, 9, 13, 8])
+    
+    def test_only_invalid_inputs_use_add(self):
+        """Test that a batch with invalid inputs still sums its clean inputs together."""
+        inputs = ["1,2", "1 2", "3, 4", "1,-2", "5", "1, ,2"]
+        expected = self.expected(inputs)
+        calls = []
+        add = self.calculator.add
+        self.calculator.add = lambda numbers: calls.append(numbers) or add(numbers)
+        
+        self.assertEqual(self.collected(inputs), expected)
+        self.assertEqual(calls, ["1 2", "1,-2", "1, ,2"])
+    
+    def test_large_batch(self):
+        """Test that a large batch matches a loop over add()."""
+        inputs = [",".join(str((i * 7 + j) % 1500) for j in range(i % 6 + 1)) for i in range(5000)]
+        inputs[1234] = "1,-5"
+        self.assertEqual(self.collected(inputs), self.expected(inputs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Test cases for the compiled delimiter cache.
+These tests cover cache hits, LRU eviction and sharing between threads.
+"""
+import unittest
+import sys
+import os
+import threading
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StringCalculator
+
+
+class TestDelimiterCache(unittest.TestCase):
+    """Test cases for the compiled delimiter cache."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator(cache_size=2)
+    
+    def test_repeated_spec_is_a_hit(self):
+        """Test that repeating a delimiter spec reuses the compiled scanner."""
+        self.assertEqual(self.calculator.add("//[***][%%]\n1***2%%3"), 6)
+        self.assertEqual(self.calculator.add("//[***][%%]\n4***5"), 9)
+        
+        info = self.calculator.delimiter_cache_info()
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['currsize'], 1)
+    
+    def test_default_delimiters_do_not_use_cache(self):
+        """Test that inputs without a header bypass the cache."""
+        self.calculator.add("1,2,3")
+        
+        info = self.calculator.delimiter_cache_info()
+        self.assertEqual(info['hits'] + info['misses'], 0)
+    
+    def test_least_recently_used_spec_is_evicted(self):
+        """Test that the least recently used spec is evicted when the cache is full."""
+        self.calculator.add("//;\n1;2")
+        self.calculator.add("//*\n1*2")
+        self.calculator.add("//;\n1;2")
+        self.calculator.add("//%\n1%2")
+        self.calculator.add("//;\n1;2")
+        
+        info = self.calculator.delimiter_cache_info()
+        self.assertEqual(info['evictions'], 1)
+        self.assertEqual(info['currsize'], 2)
+        self.assertEqual(info['hits'], 2)
+        
+        # '*' was evicted, so using it again is a miss
+        self.calculator.add("//*\n1*2")
+        self.assertEqual(self.calculator.delimiter_cache_info()['misses'], 4)
+    
+    def test_zero_size_disables_cache(self):
+        """Test that a cache size of zero still calculates but stores nothing."""
+        calculator = StringCalculator(cache_size=0)
+        self.assertEqual(calculator.add("//;\n1;2"), 3)
+        self.assertEqual(calculator.add("//;\n1;2"), 3)
+        
+        info = calculator.delimiter_cache_info()
+        self.assertEqual(info['misses'], 2)
+        self.assertEqual(info['currsize'], 0)
+    
+    def test_negative_size_rejected(self):
+        """Test that a negative cache size is rejected."""
+        with self.assertRaises(ValueError):
+            StringCalculator(cache_size=-1)
+    
+    def test_clear_resets_statistics(self):
+        """Test that clearing the cache resets entries and counters."""
+        self.calculator.add("//;\n1;2")
+        self.calculator.clear_delimiter_cache()
+        
+        info = self.calculator.delimiter_cache_info()
+        self.assertEqual(info['misses'], 0)
+        self.assertEqual(info['currsize'], 0)
+    
+    def test_errors_unchanged_with_cached_spec(self):
+        """Test that a cached spec still reports negative numbers."""
+        self.calculator.add("//;\n1;2")
+        with self.assertRaises(ValueError) as context:
+            self.calculator.add("//;\n1;-2")
+        
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -2")
+    
+    def test_shared_between_threads(self):
+        """Test that one calculator can be used from several threads."""
+        calculator = StringCalculator(cache_size=4)
+        specs = ["//;\n", "//[**]\n", "//[%][&]\n", "//|\n", "//#\n"]
+        separators = [";", "**", "%", "|", "#"]
+        errors = []
+        
+        def worker(offset):
+            for i in range(200):
+                index = (i + offset) % len(specs)
+                numbers = specs[index] + separators[index].join(["1", "2", "3"])
+                if calculator.add(numbers) != 6:
+                    errors.append(numbers)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        info = calculator.delimiter_cache_info()
+        self.assertEqual(info['hits'] + info['misses'], 8 * 200)
+        self.assertLessEqual(info['currsize'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
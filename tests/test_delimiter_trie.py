@@ -0,0 +1,70 @@
+"""
+Test cases for the trie-based delimiter matcher.
+These tests cover the longest-match rule for overlapping delimiters and inputs with many delimiters.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from string_calculator import StringCalculator, _DelimiterTrie
+from staged_parsing import parse_numbers
+
+
+class TestDelimiterTrie(unittest.TestCase):
+    """Test cases for the trie-based delimiter matcher."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+    
+    def test_longest_delimiter_wins(self):
+        """Test that the longest delimiter starting at a position is used."""
+        self.assertEqual(self.calculator.add("//[x][x1]\n5x12"), 7)
+        self.assertEqual(self.calculator.add("//[x1][x]\n5x12"), 7)
+        self.assertEqual(self.calculator.add("//[,][,-]\n1,-2"), 3)
+    
+    def test_shorter_delimiter_used_when_longer_does_not_match(self):
+        """Test that a shorter delimiter still matches where a longer one cannot."""
+        self.assertEqual(self.calculator.add("//[a][abc]\n1a2abc3"), 6)
+        self.assertEqual(self.calculator.add("//[abc][a]\n1abc2a3"), 6)
+    
+    def test_leftmost_match_wins_over_longer_later_match(self):
+        """Test that a match starting earlier wins over a longer one starting later."""
+        with self.assertRaises(ValueError) as context:
+            self.calculator.add("//[ab][bcd]\n1abcd2")
+        
+        self.assertEqual(str(context.exception), "Invalid input: non-integer number not allowed: cd2")
+    
+    def test_dozens_of_delimiters(self):
+        """Test inputs declaring dozens of long, overlapping delimiters."""
+        delimiters = [f"{prefix}{'#' * length}" for prefix in "abcdefghij" for length in range(1, 6)]
+        header = "//" + "".join(f"[{delim}]" for delim in delimiters) + "\n"
+        numbers = "".join(f"{i}{delimiters[i % len(delimiters)]}" for i in range(500)) + "1"
+        self.assertEqual(self.calculator.add(header + numbers), sum(range(500)) + 1)
+    
+    def test_same_results_as_parse_numbers(self):
+        """Test that the staged parser applies the same longest-match rule."""
+        delimiters = self.calculator._parse_custom_delimiters("[*][**][***]")
+        self.assertEqual(parse_numbers("1***2**3*4", delimiters), [1, 2, 3, 4])
+    
+    def test_deep_prefix_chain_falls_back_to_sorted_alternation(self):
+        """Test that deeply nested prefixes still follow the longest-match rule."""
+        delimiters = ["a" * length for length in range(1, _DelimiterTrie.MAX_NESTING + 10)]
+        trie = _DelimiterTrie(delimiters)
+        self.assertTrue(trie.pattern().startswith("a" * (len(delimiters))))
+        
+        header = "//" + "".join(f"[{delim}]" for delim in delimiters) + "\n"
+        self.assertEqual(self.calculator.add(header + "1" + "a" * 100 + "2"), 3)
+    
+    def test_bytes_delimiters(self):
+        """Test that file summation uses the same longest-match rule."""
+        self.assertEqual(self.calculator._add_buffer("//[x][x1]\n5x12".encode('utf-8')), 7)
+        self.assertEqual(self.calculator._add_buffer("//[é][éé]\n1éé2".encode('utf-8')), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
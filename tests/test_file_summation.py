@@ -0,0 +1,97 @@
+"""
+Test cases for memory-mapped file summation and the command-line interface.
+These tests cover add_file() and `python -m string_calculator sum FILE`.
+"""
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StringCalculator
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+class TestFileSummation(unittest.TestCase):
+    """Test cases for memory-mapped file summation."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        """Remove temporary files after each test method."""
+        self.temp_dir.cleanup()
+    
+    def write_file(self, content):
+        """Write content as UTF-8 to a temporary file and return its path."""
+        path = os.path.join(self.temp_dir.name, 'numbers.txt')
+        with open(path, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        return path
+    
+    def outcome(self, func, *args):
+        """Return ('result', value) or ('error', message) for a call."""
+        try:
+            return ('result', func(*args))
+        except ValueError as e:
+            return ('error', str(e))
+    
+    def test_empty_file_returns_zero(self):
+        """Test that an empty file returns 0."""
+        self.assertEqual(self.calculator.add_file(self.write_file("")), 0)
+    
+    def test_default_and_custom_delimiters(self):
+        """Test that file results match add() for default and custom delimiters."""
+        for numbers in ["1,2\n3\t4", "//;\n1;2;3", "//[***][%]\n1***2%3", "//[é]\n1é2", "1001,2", "//\n123"]:
+            self.assertEqual(self.calculator.add_file(self.write_file(numbers)), self.calculator.add(numbers))
+    
+    def test_errors_match_add(self):
+        """Test that file errors match add()."""
+        for numbers in ["1,-2,3,-4", "1,2.5", "1,abc", "1,\n", "1, \n", "//;1;2", "1,١,2"]:
+            self.assertEqual(
+                self.outcome(self.calculator.add_file, self.write_file(numbers)),
+                self.outcome(self.calculator.add, numbers))
+    
+    def test_large_file(self):
+        """Test that a large file is summed correctly."""
+        numbers = "\n".join(str(i % 2000) for i in range(50000))
+        self.assertEqual(self.calculator.add_file(self.write_file(numbers)), self.calculator.add(numbers))
+    
+    def test_cli_sum(self):
+        """Test that the sum command prints the result."""
+        path = self.write_file("//[*][%]\n1*2%3")
+        completed = subprocess.run(
+            [sys.executable, '-m', 'string_calculator', 'sum', path],
+            cwd=PROJECT_ROOT, capture_output=True, text=True)
+        
+        self.assertEqual(completed.returncode, 0)
+        self.assertEqual(completed.stdout.strip(), "6")
+    
+    def test_cli_reports_errors(self):
+        """Test that the sum command reports calculation errors on stderr."""
+        path = self.write_file("1,-2")
+        completed = subprocess.run(
+            [sys.executable, '-m', 'string_calculator', 'sum', path],
+            cwd=PROJECT_ROOT, capture_output=True, text=True)
+        
+        self.assertEqual(completed.returncode, 1)
+        self.assertIn("negative numbers not allowed: -2", completed.stderr)
+    
+    def test_cli_reads_standard_input(self):
+        """Test that '-' streams the input from stdin."""
+        completed = subprocess.run(
+            [sys.executable, '-m', 'string_calculator', 'sum', '-'],
+            cwd=PROJECT_ROOT, input="1\n2,3", capture_output=True, text=True)
+        
+        self.assertEqual(completed.returncode, 0)
+        self.assertEqual(completed.stdout.strip(), "6")
+
+
+if __name__ == '__main__':
+    unittest.main()
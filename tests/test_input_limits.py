@@ -0,0 +1,114 @@
+"""
+Test cases for the configurable input size limits.
+These tests cover the number, delimiter count and delimiter length limits and how early they abort parsing.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import InputTooLargeError, StringCalculator
+
+
+class TestInputLimits(unittest.TestCase):
+    """Test cases for the input size limits."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator(max_numbers=3, max_delimiters=2, max_delimiter_length=3)
+    
+    def test_unlimited_by_default(self):
+        """Test that a default calculator accepts inputs of any size."""
+        calculator = StringCalculator()
+        self.assertEqual(calculator.add(",".join(["1"] * 100000)), 100000)
+    
+    def test_invalid_limits_rejected(self):
+        """Test that limits must be positive integers."""
+        for kwargs in [{'max_numbers': 0}, {'max_delimiters': -1}, {'max_delimiter_length': 0}]:
+            with self.assertRaises(ValueError):
+                StringCalculator(**kwargs)
+    
+    def test_number_limit(self):
+        """Test that inputs with up to max_numbers numbers are summed and longer ones rejected."""
+        self.assertEqual(self.calculator.add("1,2,3"), 6)
+        self.assertEqual(self.calculator.add("1,,2\n\n3"), 6)
+        
+        with self.assertRaises(InputTooLargeError) as context:
+            self.calculator.add("1,2,3,4")
+        
+        self.assertEqual(str(context.exception), "Input too large: more than 3 numbers")
+    
+    def test_number_limit_with_custom_delimiters(self):
+        """Test that the number limit applies to every kind of delimiter set."""
+        for numbers in ["//;\n1;2;3;4", "//[*][%]\n1*2%3*4", "//[**][*]\n1**2*3**4", "//\n1234"]:
+            with self.assertRaises(InputTooLargeError, msg=repr(numbers)):
+                self.calculator.add(numbers)
+    
+    def test_number_limit_aborts_parsing(self):
+        """Test that the limit is reported before later tokens are parsed."""
+        with self.assertRaises(InputTooLargeError):
+            self.calculator.add("1,2,3,4,x,-5")
+        
+        # Errors before the limit is reached are still reported
+        with self.assertRaises(ValueError) as context:
+            self.calculator.add("1,x,3,4")
+        
+        self.assertNotIsInstance(context.exception, InputTooLargeError)
+    
+    def test_too_large_error_is_a_value_error(self):
+        """Test that existing ValueError handlers also catch size errors."""
+        self.assertTrue(issubclass(InputTooLargeError, ValueError))
+    
+    def test_delimiter_count_limit(self):
+        """Test that headers with more than max_delimiters delimiters are rejected."""
+        self.assertEqual(self.calculator.add("//[*][%]\n1*2%3"), 6)
+        
+        with self.assertRaises(InputTooLargeError) as context:
+            self.calculator.add("//[*][%][;]\n1*2")
+        
+        self.assertEqual(str(context.exception), "Input too large: more than 2 custom delimiters")
+    
+    def test_delimiter_length_limit(self):
+        """Test that bracketed and single delimiters longer than max_delimiter_length are rejected."""
+        self.assertEqual(self.calculator.add("//[***]\n1***2"), 3)
+        
+        for numbers in ["//[****]\n1****2", "//****\n1****2"]:
+            with self.assertRaises(InputTooLargeError) as context:
+                self.calculator.add(numbers)
+            
+            self.assertEqual(str(context.exception), "Input too large: custom delimiter longer than 3 characters")
+    
+    def test_rejected_headers_are_not_cached(self):
+        """Test that a rejected delimiter spec is rejected again rather than served from the cache."""
+        for _ in range(2):
+            with self.assertRaises(InputTooLargeError):
+                self.calculator.add("//[*][%][;]\n1*2")
+        
+        self.assertEqual(self.calculator.delimiter_cache_info()['currsize'], 0)
+    
+    def test_add_many_collects_size_errors(self):
+        """Test that batch inputs over a limit get their error without failing the batch."""
+        results = self.calculator.add_many(["1,2,3", "1,2,3,4", "//[a][b][c]\n1a2", "//;\n1;2"], on_error='collect')
+        self.assertEqual(results[0], 6)
+        self.assertIsInstance(results[1], InputTooLargeError)
+        self.assertIsInstance(results[2], InputTooLargeError)
+        self.assertEqual(results[3], 3)
+    
+    def test_result_cache_keeps_error_type(self):
+        """Test that a cached size error is raised again as InputTooLargeError."""
+        calculator = StringCalculator(max_numbers=3, result_cache_size=4)
+        for _ in range(2):
+            with self.assertRaises(InputTooLargeError):
+                calculator.add("1,2,3,4")
+        
+        self.assertEqual(calculator.result_cache_info()['hits'], 1)
+    
+    def test_stream_is_not_limited(self):
+        """Test that add_stream remains available for inputs over the number limit."""
+        self.assertEqual(self.calculator.add_stream(["1,2,", "3,4"]), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
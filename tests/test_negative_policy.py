@@ -0,0 +1,141 @@
+"""
+Test cases for the negative number policies and NegativeNumbersError.
+These tests cover collect-all, fail-fast and collect-up-to on every summation path.
+"""
+import unittest
+import sys
+import os
+import pickle
+from array import array
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import string_calculator
+from string_calculator import NegativeNumbersError, StringCalculator
+from staged_parsing import validate_negative_numbers
+
+
+class TestNegativeNumbersError(unittest.TestCase):
+    """Test cases for the exception raised for negatives."""
+    
+    def test_is_a_value_error(self):
+        """Test that existing ValueError handlers still catch negatives."""
+        with self.assertRaises(ValueError):
+            StringCalculator().add("1,-2")
+    
+    def test_negatives_stored_as_array(self):
+        """Test that the negatives are carried as a compact array('q')."""
+        with self.assertRaises(NegativeNumbersError) as context:
+            StringCalculator().add("-1,2,-3")
+        
+        self.assertEqual(context.exception.negatives, array('q', [-1, -3]))
+        self.assertEqual(context.exception.omitted, 0)
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -1 -3")
+    
+    def test_negatives_beyond_64_bits(self):
+        """Test that negatives too large for array('q') are kept in a list."""
+        error = NegativeNumbersError([-1, -99999999999999999999])
+        self.assertEqual(error.negatives, [-1, -99999999999999999999])
+        self.assertEqual(str(error), "negative numbers not allowed: -1 -99999999999999999999")
+    
+    def test_pickles(self):
+        """Test that the error survives crossing process boundaries."""
+        error = pickle.loads(pickle.dumps(NegativeNumbersError([-1, -2], omitted=3)))
+        self.assertEqual(str(error), "negative numbers not allowed: -1 -2 (and 3 more)")
+
+
+class TestNegativePolicy(unittest.TestCase):
+    """Test cases for the negative_policy option."""
+    
+    def assertNegatives(self, calculator, numbers, negatives, omitted=0):
+        """Assert that numbers raises NegativeNumbersError with the given negatives."""
+        with self.assertRaises(NegativeNumbersError) as context:
+            calculator.add(numbers)
+        
+        self.assertEqual((list(context.exception.negatives), context.exception.omitted), (negatives, omitted))
+    
+    def test_invalid_policy_rejected(self):
+        """Test that unknown policies and non-positive limits raise ValueError."""
+        with self.assertRaises(ValueError):
+            StringCalculator(negative_policy='ignore')
+        with self.assertRaises(ValueError):
+            StringCalculator(negative_policy='collect-up-to', max_negatives=0)
+    
+    def test_collect_all_is_default(self):
+        """Test that every negative is reported by default."""
+        self.assertNegatives(StringCalculator(), "-1,2,-3,-4", [-1, -3, -4])
+    
+    def test_fail_fast(self):
+        """Test that fail-fast reports only the first negative."""
+        calculator = StringCalculator(negative_policy='fail-fast')
+        self.assertNegatives(calculator, "1,-2,-3,-4", [-2])
+        
+        with self.assertRaises(NegativeNumbersError) as context:
+            calculator.add("1,-2,-3")
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -2")
+    
+    def test_fail_fast_stops_scanning(self):
+        """Test that fail-fast raises before later invalid tokens are reached."""
+        self.assertNegatives(StringCalculator(negative_policy='fail-fast'), "-1,x", [-1])
+        
+        # Invalid tokens before the first negative are still reported first
+        with self.assertRaises(ValueError) as context:
+            StringCalculator(negative_policy='fail-fast').add("x,-1")
+        self.assertNotIsInstance(context.exception, NegativeNumbersError)
+    
+    def test_collect_up_to(self):
+        """Test that collect-up-to reports the first negatives and counts the rest."""
+        calculator = StringCalculator(negative_policy='collect-up-to', max_negatives=2)
+        self.assertNegatives(calculator, "-1,-2,3,-4,-5", [-1, -2], omitted=2)
+        self.assertNegatives(calculator, "-1,3", [-1])
+        
+        with self.assertRaises(NegativeNumbersError) as context:
+            calculator.add("-1,-2,-3")
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -1 -2 (and 1 more)")
+    
+    def test_collect_up_to_keeps_error_precedence(self):
+        """Test that an invalid token after the kept negatives is still reported."""
+        with self.assertRaises(ValueError) as context:
+            StringCalculator(negative_policy='collect-up-to', max_negatives=1).add("-1,-2,x")
+        
+        self.assertNotIsInstance(context.exception, NegativeNumbersError)
+    
+    def test_policies_on_other_paths(self):
+        """Test that streaming, accumulators and the staged helper apply the policy."""
+        calculator = StringCalculator(negative_policy='collect-up-to', max_negatives=1)
+        
+        with self.assertRaises(NegativeNumbersError) as context:
+            calculator.add_stream(["-1,", "-2,", "-3"])
+        self.assertEqual((list(context.exception.negatives), context.exception.omitted), ([-1], 2))
+        
+        accumulator = calculator.accumulator()
+        accumulator.feed("-1,-2,3")
+        with self.assertRaises(NegativeNumbersError) as context:
+            accumulator.result()
+        self.assertEqual((list(context.exception.negatives), context.exception.omitted), ([-1], 1))
+        
+        with self.assertRaises(NegativeNumbersError) as context:
+            validate_negative_numbers(calculator, [-1, 2, -3])
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -1 (and 1 more)")
+    
+    @unittest.skipIf(string_calculator.np is None, "NumPy is not installed")
+    def test_policies_with_numpy_backend(self):
+        """Test that the NumPy backend applies the policy to its vectorised negatives."""
+        self.assertNegatives(StringCalculator(backend='numpy', negative_policy='fail-fast'), "-1,-2,-3", [-1])
+        self.assertNegatives(StringCalculator(backend='numpy', negative_policy='collect-up-to', max_negatives=2),
+                             "-1,-2,-3", [-1, -2], omitted=1)
+    
+    def test_many_negatives(self):
+        """Test that a capped policy keeps the message small for huge numbers of negatives."""
+        numbers = ",".join(["-7"] * 100000)
+        with self.assertRaises(NegativeNumbersError) as context:
+            StringCalculator(negative_policy='collect-up-to', max_negatives=10).add(numbers)
+        
+        self.assertEqual(context.exception.omitted, 99990)
+        self.assertLess(len(str(context.exception)), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ These tests cover handling newlines as delimiters between numbers.
 import unittest
 import sys
 import os
+import time
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
@@ -54,6 +55,35 @@ class TestNewlineDelimiters(unittest.TestCase):
         result = self.calculator.add("\n\n")
         self.assertEqual(result, 0)
 
+    
+    def test_comma_before_trailing_newline_rejected(self):
+        """Test that a comma followed by trailing whitespace with a newline is rejected."""
+        for numbers in ["1,\n", "1, \n \t", "1,\n\n", "//[,][;]\n1;2,\n"]:
+            with self.assertRaises(ValueError) as context:
+                self.calculator.add(numbers)
+            self.assertEqual(str(context.exception), "Invalid input: trailing delimiter ',' not allowed")
+    
+    def test_trailing_delimiter_check_is_linear(self):
+        """Test that long whitespace runs after a comma take linear time to validate."""
+        def validation_time(numbers):
+            started = time.perf_counter()
+            try:
+                self.calculator._validate_input_format(numbers, [',', '\n', '\t'])
+            except ValueError:
+                pass
+            return time.perf_counter() - started
+        
+        # Runs of whitespace overlapping the newline made the old regex backtrack quadratically
+        for make in (lambda n: "1," + " \n" * n, lambda n: "1," + " \n" * n + "x", lambda n: ", \n" * n + "x"):
+            small = min(validation_time(make(10000)) for _ in range(3))
+            large = min(validation_time(make(160000)) for _ in range(3))
+            # 16 times the input: about 16 times the time, where quadratic growth would be 256 times
+            self.assertLess(large, 64 * small + 0.01)
+            self.assertLess(large, 1.0)
+        
+        with self.assertRaises(ValueError):
+            self.calculator.add("1," + " \n" * 1000000)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+"""
+Test cases for the optional NumPy backend.
+These tests check that NumPy parsing matches the pure-Python backend and falls back when needed.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+import string_calculator
+from string_calculator import StringCalculator
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test cases for choosing a backend."""
+    
+    def test_invalid_backend_rejected(self):
+        """Test that an unknown backend name raises ValueError."""
+        with self.assertRaises(ValueError):
+            StringCalculator(backend='fortran')
+    
+    def test_falls_back_without_numpy(self):
+        """Test that the numpy backend uses pure Python when NumPy is not installed."""
+        original = string_calculator.np
+        string_calculator.np = None
+        try:
+            calculator = StringCalculator(backend='numpy')
+            self.assertEqual(calculator.add("1,2,3"), 6)
+            self.assertIsNone(calculator._default_scanner.for_numpy())
+        finally:
+            string_calculator.np = original
+
+
+@unittest.skipIf(string_calculator.np is None, "NumPy is not installed")
+class TestNumpyBackend(unittest.TestCase):
+    """Test cases for the NumPy backend."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator(backend='numpy')
+        self.python_calculator = StringCalculator(backend='python')
+    
+    def assertMatchesPythonBackend(self, numbers):
+        """Assert that both backends agree on result or error message."""
+        try:
+            expected = ('result', self.python_calculator.add(numbers))
+        except ValueError as e:
+            expected = ('error', str(e))
+        
+        try:
+            actual = ('result', self.calculator.add(numbers))
+        except ValueError as e:
+            actual = ('error', str(e))
+        
+        self.assertEqual(actual, expected, repr(numbers))
+    
+    def test_default_delimiters(self):
+        """Test default delimiter inputs, including empty tokens and numbers > 1000."""
+        for numbers in ["1,2\n3\t4", "1,,2", ",1,2,", "1000,1001,2", "007,1", "1\n2\n"]:
+            self.assertMatchesPythonBackend(numbers)
+    
+    def test_custom_delimiters(self):
+        """Test single, multi-character and overlapping custom delimiters."""
+        for numbers in ["//;\n1;2;3", "//[***][%%]\n1***2%%3", "//[*][**]\n1**2*3", "//1\n213", "//-\n1-2"]:
+            self.assertMatchesPythonBackend(numbers)
+    
+    def test_negatives_reported_in_order(self):
+        """Test that negatives are detected with masks and listed in input order."""
+        for numbers in ["-5,1,-1001,2,-3", "1,-0,2", "-9223372036854775808,1"]:
+            self.assertMatchesPythonBackend(numbers)
+    
+    def test_other_inputs_fall_back(self):
+        """Test that inputs NumPy cannot prove valid keep the pure-Python errors."""
+        for numbers in ["1,2.5", "1,x", "1, 2", "1,--2", "1,-,2", "1-2", "//;\n1,2", "١,2",
+                        "99999999999999999999,1", "-99999999999999999999", "1,\n"]:
+            self.assertMatchesPythonBackend(numbers)
+    
+    def test_large_input(self):
+        """Test that a large input is summed correctly."""
+        numbers = ",".join(str(i) for i in range(100000))
+        self.assertEqual(self.calculator.add(numbers), sum(range(1001)))
+    
+    def test_auto_backend_uses_numpy_for_large_sections(self):
+        """Test that the auto backend hands long sections to NumPy."""
+        calculator = StringCalculator()
+        numbers = ",".join(["1"] * string_calculator.NUMPY_MIN_LENGTH)
+        self.assertEqual(calculator.add(numbers), string_calculator.NUMPY_MIN_LENGTH)
+        self.assertIsNotNone(calculator._default_scanner._numpy_summer)
+        
+        calculator = StringCalculator()
+        calculator.add("1,2")
+        self.assertIsNone(calculator._default_scanner._numpy_summer)
+
+
+if __name__ == '__main__':
+    unittest.main()
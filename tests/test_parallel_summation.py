@@ -0,0 +1,102 @@
+"""
+Test cases for parallel summation of large inputs.
+These tests cover chunking at token boundaries and ordered merging of results.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StringCalculator, _scan_chunk
+
+
+class TestParallelSummation(unittest.TestCase):
+    """Test cases for parallel summation."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Start one worker pool for all tests."""
+        cls.parallel = StringCalculator(parallel_threshold=0, max_workers=3)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the worker pool."""
+        cls.parallel.close()
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.serial = StringCalculator()
+    
+    def outcome(self, calculator, numbers):
+        """Return ('result', value) or ('error', message) for add()."""
+        try:
+            return ('result', calculator.add(numbers))
+        except ValueError as e:
+            return ('error', str(e))
+    
+    def assertMatchesSerial(self, numbers):
+        """Assert that the parallel path agrees with the serial scan."""
+        self.assertEqual(self.outcome(self.parallel, numbers), self.outcome(self.serial, numbers), repr(numbers[:60]))
+    
+    def test_default_delimiters(self):
+        """Test that a large default-delimiter input is summed correctly."""
+        numbers = "\n".join(",".join(str(i % 1500) for i in range(row, row + 50)) for row in range(0, 5000, 50))
+        self.assertMatchesSerial(numbers)
+    
+    def test_custom_delimiters(self):
+        """Test that multi-character delimiters are never split between chunks."""
+        numbers = "//[***][%]\n" + "***".join(f"{i}%{i + 1}" for i in range(2000))
+        self.assertMatchesSerial(numbers)
+    
+    def test_overlapping_delimiters(self):
+        """Test that overlapping delimiter runs split like the serial scan."""
+        for numbers in ["//[**]\n" + "***".join(str(i) for i in range(500)),
+                        "//[a][ab]\n" + "ab".join(str(i) for i in range(500))]:
+            self.assertMatchesSerial(numbers)
+    
+    def test_negatives_reported_in_input_order(self):
+        """Test that negatives from every chunk are listed in input order."""
+        numbers = ",".join(str(-i if i % 97 == 0 else i) for i in range(1, 3000))
+        self.assertMatchesSerial(numbers)
+    
+    def test_first_invalid_token_reported(self):
+        """Test that the earliest invalid token wins over later chunks."""
+        values = [str(i) for i in range(3000)]
+        values[100] = "1.5"
+        values[2900] = "abc"
+        self.assertMatchesSerial(",".join(values))
+    
+    def test_worker_pieces(self):
+        """Test that a worker sums clean pieces and reports errors in dirty ones."""
+        delimiters = (',', '\n', '\t')
+        self.assertEqual(_scan_chunk(delimiters, "1,2\n2000,3,")[0], 6)
+        self.assertEqual(_scan_chunk(delimiters, "1,-2,3")[:2], (4, [-2]))
+        with self.assertRaises(ValueError):
+            _scan_chunk(delimiters, "1,x")
+    
+    def test_below_threshold_stays_serial(self):
+        """Test that inputs below the threshold do not start a worker pool."""
+        calculator = StringCalculator(parallel_threshold=1000)
+        self.assertEqual(calculator.add("1,2,3"), 6)
+        self.assertIsNone(calculator._executor)
+    
+    def test_threshold_applies_with_auto_backend(self):
+        """Test that inputs past the threshold use the pool even when NumPy could sum them."""
+        calculator = StringCalculator(parallel_threshold=1000, max_workers=2, backend='auto')
+        try:
+            numbers = ",".join(str(i % 2000) for i in range(1000))
+            self.assertEqual(calculator.add(numbers), self.serial.add(numbers))
+            self.assertIsNotNone(calculator._executor)
+        finally:
+            calculator.close()
+    
+    def test_negative_threshold_rejected(self):
+        """Test that a negative threshold is rejected."""
+        with self.assertRaises(ValueError):
+            StringCalculator(parallel_threshold=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Test cases for per-stage profiling of add().
+These tests cover the stages recorded for each call and the StageProfiler histograms.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import StageProfiler, StringCalculator
+
+
+class RecordingProfiler:
+    """Profiler that keeps every record() call."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def record(self, stages, tokens, nbytes, error):
+        self.calls.append((stages, tokens, nbytes, error))
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for the profiler hook."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.profiler = RecordingProfiler()
+        self.calculator = StringCalculator(profiler=self.profiler)
+    
+    def test_disabled_by_default(self):
+        """Test that calculators do not profile unless given a profiler."""
+        self.assertIsNone(StringCalculator().profiler)
+    
+    def test_stages_recorded(self):
+        """Test that every stage of a successful call is timed."""
+        self.assertEqual(self.calculator.add("//;\n1;2;3"), 6)
+        
+        stages, tokens, nbytes, error = self.profiler.calls[0]
+        self.assertEqual(set(stages), {'delimiters', 'validate', 'sum', 'total'})
+        self.assertTrue(all(seconds >= 0 for seconds in stages.values()))
+        self.assertGreaterEqual(stages['total'], stages['sum'])
+        self.assertEqual((tokens, nbytes, error), (3, 9, False))
+    
+    def test_failing_stage_not_recorded(self):
+        """Test that a call that raises records the stages before the failure."""
+        with self.assertRaises(ValueError):
+            self.calculator.add("1,-2")
+        with self.assertRaises(ValueError):
+            self.calculator.add("//[*]")
+        
+        self.assertEqual(set(self.profiler.calls[0][0]), {'delimiters', 'validate', 'total'})
+        self.assertTrue(self.profiler.calls[0][3])
+        self.assertEqual(set(self.profiler.calls[1][0]), {'total'})
+        self.assertTrue(self.profiler.calls[1][3])
+    
+    def test_token_count_and_bytes(self):
+        """Test that tokens include empty ones and bytes count UTF-8 encoded size."""
+        self.calculator.add("//[é]\n1é2éé3")
+        _, tokens, nbytes, _ = self.profiler.calls[0]
+        self.assertEqual((tokens, nbytes), (4, len("//[é]\n1é2éé3".encode('utf-8'))))
+    
+    def test_tokens_counted_during_scan(self):
+        """Test that every sum path counts tokens while scanning, without a second pass."""
+        inputs = ["1,2,,3", "1, 2,3", "//[***][%%]\n1***2%%3***", "//\n123", ",".join(["7"] * 2000)]
+        for backend in ('python', 'numpy'):
+            calculator = StringCalculator(backend=backend, profiler=self.profiler)
+            for numbers in inputs:
+                delimiter_spec, numbers_part = calculator._split_delimiter_header(numbers)
+                scanner = calculator._get_scanner(delimiter_spec)
+                expected = scanner.count_tokens(numbers_part)
+                
+                scanner.count_tokens = None
+                try:
+                    calculator.add(numbers)
+                finally:
+                    del scanner.count_tokens
+                self.assertEqual(self.profiler.calls[-1][1], expected, (backend, numbers))
+    
+    def test_result_cache_hits_not_profiled(self):
+        """Test that only calls that are calculated are profiled."""
+        calculator = StringCalculator(profiler=self.profiler, result_cache_size=4)
+        calculator.add("1,2")
+        calculator.add("1,2")
+        self.assertEqual(len(self.profiler.calls), 1)
+
+
+class TestStageProfiler(unittest.TestCase):
+    """Test cases for the histogram aggregator."""
+    
+    def test_histograms(self):
+        """Test that stage times, tokens and bytes are bucketed cumulatively."""
+        profiler = StageProfiler(seconds_buckets=(0.5, 1.0), tokens_buckets=(2,), bytes_buckets=(10,))
+        profiler.record({'sum': 0.25, 'total': 0.75}, tokens=2, nbytes=5, error=False)
+        profiler.record({'sum': 2.0, 'total': 3.0}, tokens=3, nbytes=50, error=True)
+        
+        histograms = profiler.histograms()
+        self.assertEqual((histograms['calls'], histograms['errors']), (2, 1))
+        self.assertEqual(histograms['stage_seconds']['sum'],
+                         {'buckets': [(0.5, 1), (1.0, 1), (float('inf'), 2)], 'sum': 2.25, 'count': 2})
+        self.assertEqual(histograms['stage_seconds']['total']['buckets'], [(0.5, 0), (1.0, 1), (float('inf'), 2)])
+        self.assertEqual(histograms['tokens']['buckets'], [(2, 1), (float('inf'), 2)])
+        self.assertEqual(histograms['bytes']['buckets'], [(10, 1), (float('inf'), 2)])
+    
+    def test_used_as_calculator_profiler(self):
+        """Test that StageProfiler aggregates calls made by a calculator."""
+        profiler = StageProfiler()
+        calculator = StringCalculator(profiler=profiler)
+        for numbers in ["1,2", "3", "4,-5"]:
+            try:
+                calculator.add(numbers)
+            except ValueError:
+                pass
+        
+        histograms = profiler.histograms()
+        self.assertEqual((histograms['calls'], histograms['errors']), (3, 1))
+        self.assertEqual(histograms['stage_seconds']['total']['count'], 3)
+        self.assertEqual(histograms['stage_seconds']['sum']['count'], 2)
+        self.assertEqual(histograms['tokens']['sum'], 5)
+    
+    def test_clear(self):
+        """Test that clear() discards recorded calls."""
+        profiler = StageProfiler()
+        profiler.record({'total': 0.1}, tokens=1, nbytes=1, error=False)
+        profiler.clear()
+        
+        histograms = profiler.histograms()
+        self.assertEqual((histograms['calls'], histograms['stage_seconds']), (0, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Test cases for the opt-in add() result cache.
+These tests cover cached sums and errors, the entry and byte limits, and the statistics API.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import NegativeNumbersError, StringCalculator
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the add() result cache."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator(result_cache_size=2)
+    
+    def test_disabled_by_default(self):
+        """Test that a default calculator does not cache results."""
+        calculator = StringCalculator()
+        self.assertEqual(calculator.add("1,2"), 3)
+        self.assertEqual(calculator.add("1,2"), 3)
+        
+        info = calculator.result_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['currsize']), (0, 0, 0))
+    
+    def test_repeated_input_is_a_hit(self):
+        """Test that a repeated input returns the stored sum without parsing again."""
+        self.assertEqual(self.calculator.add("1,2,3"), 6)
+        self.calculator._add = None
+        self.assertEqual(self.calculator.add("1,2,3"), 6)
+        
+        info = self.calculator.result_cache_info()
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+    
+    def test_errors_are_cached(self):
+        """Test that a repeated bad input raises the same message from the cache."""
+        for _ in range(2):
+            with self.assertRaises(ValueError) as context:
+                self.calculator.add("1,-2,-3")
+            self.assertEqual(str(context.exception), "negative numbers not allowed: -2 -3")
+        
+        self.assertEqual(self.calculator.result_cache_info()['hits'], 1)
+    
+    def test_cached_errors_are_raised_as_copies(self):
+        """Test that each cache hit raises a new error that keeps no earlier caller's context."""
+        def add_while_handling(error):
+            try:
+                raise error
+            except KeyError:
+                try:
+                    self.calculator.add("1,-2")
+                except ValueError as e:
+                    return e
+        
+        first = add_while_handling(KeyError('from request A'))
+        second = add_while_handling(KeyError('from request B'))
+        third = add_while_handling(KeyError('from request C'))
+        self.assertIsNot(second, third)
+        self.assertIsInstance(third, NegativeNumbersError)
+        self.assertEqual(list(third.negatives), [-2])
+        self.assertEqual(str(third.__context__), "'from request C'")
+        self.assertEqual(str(first.__context__), "'from request A'")
+        self.assertEqual(str(second.__context__), "'from request B'")
+    
+    def test_entry_limit_evicts_least_recently_used(self):
+        """Test that the oldest input is evicted once the entry limit is reached."""
+        self.calculator.add("1")
+        self.calculator.add("2")
+        self.calculator.add("1")
+        self.calculator.add("3")
+        
+        info = self.calculator.result_cache_info()
+        self.assertEqual((info['currsize'], info['evictions']), (2, 1))
+        self.calculator.add("1")
+        self.assertEqual(self.calculator.result_cache_info()['hits'], 2)
+    
+    def test_byte_limit(self):
+        """Test that entries are evicted to stay within the byte budget."""
+        calculator = StringCalculator(result_cache_size=100, result_cache_bytes=400)
+        for i in range(20):
+            calculator.add(f"{i},{i}")
+        
+        info = calculator.result_cache_info()
+        self.assertLessEqual(info['currbytes'], 400)
+        self.assertLess(info['currsize'], 20)
+        self.assertGreater(info['evictions'], 0)
+    
+    def test_long_inputs_keyed_by_digest(self):
+        """Test that long inputs are cached under a fixed-size digest."""
+        numbers = ",".join(["1"] * 1000)
+        self.assertEqual(self.calculator.add(numbers), 1000)
+        self.assertEqual(self.calculator.add(numbers), 1000)
+        
+        info = self.calculator.result_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertLess(info['currbytes'], len(numbers))
+    
+    def test_clear_result_cache(self):
+        """Test that clearing empties the cache and resets its statistics."""
+        self.calculator.add("1,2")
+        self.calculator.add("1,2")
+        self.calculator.clear_result_cache()
+        
+        info = self.calculator.result_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['currsize'], info['currbytes']), (0, 0, 0, 0))
+    
+    def test_invalid_limits_rejected(self):
+        """Test that negative limits raise ValueError."""
+        with self.assertRaises(ValueError):
+            StringCalculator(result_cache_size=-1)
+        with self.assertRaises(ValueError):
+            StringCalculator(result_cache_size=1, result_cache_bytes=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,22 @@ class TestRunner:
             'test_custom_delimiters',
             'test_negative_numbers',
             'test_edge_cases',
-            'test_invalid_inputs'
+            'test_invalid_inputs',
+            'test_single_pass_scanner',
+            'test_delimiter_cache',
+            'test_streaming',
+            'test_file_summation',
+            'test_parallel_summation',
+            'test_batch_add',
+            'test_delimiter_trie',
+            'test_numpy_backend',
+            'test_result_cache',
+            'test_input_limits',
+            'test_profiling',
+            'test_accumulator',
+            'test_negative_policy',
+            'test_add_bytes',
+            'test_unescape_string'
         ]
     
     def run_all_tests(self, verbosity=2):
@@ -66,7 +81,22 @@ class TestRunner:
                 'Custom Delimiters': 'test_custom_delimiters', 
                 'Negative Numbers': 'test_negative_numbers',
                 'Edge Cases': 'test_edge_cases',
-                'Invalid Inputs': 'test_invalid_inputs'
+                'Invalid Inputs': 'test_invalid_inputs',
+                'Single-Pass Scanner': 'test_single_pass_scanner',
+                'Delimiter Cache': 'test_delimiter_cache',
+                'Streaming': 'test_streaming',
+                'File Summation': 'test_file_summation',
+                'Parallel Summation': 'test_parallel_summation',
+                'Batch Add': 'test_batch_add',
+                'Delimiter Trie': 'test_delimiter_trie',
+                'NumPy Backend': 'test_numpy_backend',
+                'Result Cache': 'test_result_cache',
+                'Input Limits': 'test_input_limits',
+                'Profiling': 'test_profiling',
+                'Accumulator': 'test_accumulator',
+                'Negative Policy': 'test_negative_policy',
+                'Bytes Input': 'test_add_bytes',
+                'Unescape String': 'test_unescape_string'
             }
         }
         return summary
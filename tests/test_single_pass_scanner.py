@@ -0,0 +1,96 @@
+"""
+Test cases for the single-pass scanner used by add().
+These tests check that the scanner matches the staged parsing path exactly.
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from string_calculator import StringCalculator
+from staged_parsing import staged_add
+
+
+class TestSinglePassScanner(unittest.TestCase):
+    """Test cases for the single-pass scanner."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+    
+    def assertMatchesStagedPath(self, numbers):
+        """Assert that add() and the staged path agree on result or error message."""
+        try:
+            expected = ('result', staged_add(self.calculator, numbers))
+        except ValueError as e:
+            expected = ('error', str(e))
+        
+        try:
+            actual = ('result', self.calculator.add(numbers))
+        except ValueError as e:
+            actual = ('error', str(e))
+        
+        self.assertEqual(actual, expected, repr(numbers))
+    
+    def test_default_delimiters(self):
+        """Test that default delimiter inputs match the staged path."""
+        for numbers in ["1,2,3", "1\n2\t3", " 1 , 2 ", "1,,2", "1,2,", "1\n2\n"]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_custom_delimiters(self):
+        """Test that custom delimiter inputs match the staged path."""
+        for numbers in ["//;\n1;2;3", "//[***]\n1***2***3", "//[*][%]\n1*2%3", "//.\n1.2.3", "//\\\n1\\2\\3"]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_overlapping_delimiters_use_longest_match(self):
+        """Test that overlapping delimiters pick the longest match like the staged path."""
+        for numbers in ["//[a][ab]\n1ab2", "//[ab][a]\n1ab2", "//[*][**]\n1**2", "//[**][*]\n1***2"]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_empty_custom_delimiter(self):
+        """Test that an empty custom delimiter splits between characters like re.split."""
+        for numbers in ["//\n123", "//\n1,2,3"]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_numbers_over_1000_ignored(self):
+        """Test that the cutoff is applied while scanning."""
+        self.assertEqual(self.calculator.add("1000,1001,2"), 1002)
+    
+    def test_error_messages_match(self):
+        """Test that decimal, non-integer and negative errors match the staged path."""
+        for numbers in ["1,2.5,-3", "1,abc,-3", "-1,2,-3", "-1,x", "1,-0,2", "1, 2 3", "1,-,2"]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_negatives_listed_in_input_order(self):
+        """Test that negatives are reported in the order they appear."""
+        with self.assertRaises(ValueError) as context:
+            self.calculator.add("-5,1,-1001,2,-3")
+        
+        self.assertEqual(str(context.exception), "negative numbers not allowed: -5 -1001 -3")
+    
+    def test_unicode_digits(self):
+        """Test that unicode decimal digits are accepted like the regex \\d check."""
+        self.assertMatchesStagedPath("١,2")
+        self.assertMatchesStagedPath("²,2")
+    
+    def test_digit_only_fast_path(self):
+        """Test that digit-only inputs summed with translate/split match the staged path."""
+        for numbers in ["1,2\n3\t4", "1,,2\n\n3", ",1,2,", "1\t1001\n2", "//;\n1;2;;3", "//1\n213", "0"]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_fast_path_keeps_error_semantics(self):
+        """Test that inputs the fast path cannot prove as digits still raise the usual errors."""
+        for numbers in ["1,2.5", "1,x,2", "1,-2,-3", "1,+2", "1,1_000", "//;\n1,2", "1," + "9" * 5000]:
+            self.assertMatchesStagedPath(numbers)
+    
+    def test_large_input(self):
+        """Test that a large input is summed correctly."""
+        numbers = ",".join(str(i) for i in range(100000))
+        self.assertEqual(self.calculator.add(numbers), sum(range(1001)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Test cases for streaming addition with add_stream().
+These tests cover file-like objects, iterables of chunks and chunk boundaries.
+"""
+import unittest
+import sys
+import os
+import io
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'string_calculator'))
+
+from string_calculator import InputTooLargeError, StringCalculator
+
+
+class TestStreaming(unittest.TestCase):
+    """Test cases for streaming addition."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = StringCalculator()
+    
+    def outcome(self, func, *args, **kwargs):
+        """Return ('result', value) or ('error', message) for a call."""
+        try:
+            return ('result', func(*args, **kwargs))
+        except ValueError as e:
+            return ('error', str(e))
+    
+    def assertStreamMatchesAdd(self, numbers):
+        """Assert that add_stream() agrees with add() for every small chunk size."""
+        expected = self.outcome(self.calculator.add, numbers)
+        for chunk_size in range(1, 6):
+            chunks = [numbers[i:i + chunk_size] for i in range(0, len(numbers), chunk_size)]
+            self.assertEqual(self.outcome(self.calculator.add_stream, chunks), expected, (numbers, chunk_size))
+            self.assertEqual(
+                self.outcome(self.calculator.add_stream, io.StringIO(numbers), chunk_size=chunk_size),
+                expected, (numbers, chunk_size))
+    
+    def test_empty_stream_returns_zero(self):
+        """Test that an empty stream returns 0."""
+        self.assertEqual(self.calculator.add_stream(io.StringIO("")), 0)
+        self.assertEqual(self.calculator.add_stream([]), 0)
+    
+    def test_default_delimiters_across_chunks(self):
+        """Test that digit runs split between chunks are joined."""
+        self.assertEqual(self.calculator.add_stream(["1", "2,3", "4\n5"]), 12 + 34 + 5)
+        self.assertStreamMatchesAdd("10,200\n300\t4,5")
+    
+    def test_header_split_between_chunks(self):
+        """Test that a custom delimiter header split between chunks is read once."""
+        self.assertEqual(self.calculator.add_stream(["/", "/[**", "*][%]", "\n1***2%3"]), 6)
+        self.assertStreamMatchesAdd("//[***][%]\n1***2%3")
+    
+    def test_multi_character_delimiter_split_between_chunks(self):
+        """Test that a delimiter split between chunks is still recognised."""
+        self.assertEqual(self.calculator.add_stream(["//[***]\n1*", "*", "*2**", "*3"]), 6)
+    
+    def test_overlapping_delimiters_across_chunks(self):
+        """Test that delimiter priority is the same as add() at chunk boundaries."""
+        for numbers in ["//[a][ab]\n1ab2", "//[ab][b]\n1ab2b3", "//[*][**]\n1**2***3"]:
+            self.assertStreamMatchesAdd(numbers)
+    
+    def test_errors_match_add(self):
+        """Test that errors from add_stream() match add()."""
+        for numbers in ["1,-2,3,-4", "1,2.5,3", "1,abc", "//;1;2", "1,x,\n", "-1,\n", "//\n12"]:
+            self.assertStreamMatchesAdd(numbers)
+    
+    def test_trailing_delimiter_error_takes_precedence(self):
+        """Test that a trailing delimiter is reported even after a bad token."""
+        with self.assertRaises(ValueError) as context:
+            self.calculator.add_stream(["1,x", ",2,", " \n"])
+        
+        self.assertEqual(str(context.exception), "Invalid input: trailing delimiter ',' not allowed")
+    
+    def test_binary_file(self):
+        """Test that binary file objects are decoded incrementally."""
+        data = "//[é]\n1é2é3".encode('utf-8')
+        self.assertEqual(self.calculator.add_stream(io.BytesIO(data), chunk_size=1), 6)
+    
+    def test_stream_that_rejects_empty_reads(self):
+        """Test that streams are never probed with read(0), which WSGI inputs treat as a disconnect."""
+        class Stream(io.BytesIO):
+            def read(self, size=-1):
+                if size == 0:
+                    raise IOError("client disconnected")
+                return super().read(size)
+        
+        self.assertEqual(self.calculator.add_stream(Stream(b"1,2,3"), chunk_size=2), 6)
+    
+    def test_large_generator(self):
+        """Test that a long stream of small chunks is summed correctly."""
+        chunks = (f"{i % 1500}," for i in range(100000))
+        expected = sum(i % 1500 for i in range(100000) if i % 1500 <= 1000)
+        self.assertEqual(self.calculator.add_stream(chunks), expected)
+    
+    def test_header_without_newline_is_capped(self):
+        """Test that an unterminated header is rejected once it passes the delimiter limits."""
+        calculator = StringCalculator(max_delimiters=2, max_delimiter_length=3)
+        read = []
+        
+        def chunks():
+            yield "//"
+            for _ in range(10000):
+                read.append(1)
+                yield "[*]"
+        
+        with self.assertRaises(InputTooLargeError):
+            calculator.add_stream(chunks())
+        self.assertLess(len(read), 10)
+        self.assertEqual(calculator.add_stream(["//[***]", "[%%%]", "\n1***2%%%3"]), 6)
+    
+    def test_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        with self.assertRaises(ValueError):
+            self.calculator.add_stream(io.StringIO("1,2"), chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Test cases for unescape_string in the web UI.
+These tests check that escape sequences typed into the UI are decoded in one pass.
+"""
+import importlib.util
+import unittest
+import sys
+import os
+
+# Flask and prometheus_client are only needed for the web UI
+HAS_UI_DEPENDENCIES = all(importlib.util.find_spec(name) for name in ('flask', 'prometheus_client'))
+
+if HAS_UI_DEPENDENCIES:
+    # Add ui directory to path for imports
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ui'))
+    
+    # The other test modules put string_calculator/ on the path and import
+    # string_calculator.py as a top-level module, while the app imports it from
+    # the string_calculator package; hide the module while the app is imported
+    saved_path = sys.path[:]
+    saved_module = sys.modules.pop('string_calculator', None)
+    sys.path[:] = [path for path in sys.path if os.path.basename(os.path.normpath(path)) != 'string_calculator']
+    try:
+        from app import unescape_string
+    finally:
+        sys.path[:] = saved_path
+        sys.modules.pop('string_calculator', None)
+        if saved_module is not None:
+            sys.modules['string_calculator'] = saved_module
+
+
+@unittest.skipUnless(HAS_UI_DEPENDENCIES, "Web UI dependencies are not installed")
+class TestUnescapeString(unittest.TestCase):
+    """Test cases for unescape_string."""
+    
+    def test_escaped_newline(self):
+        """Test that '\\n' becomes a newline."""
+        self.assertEqual(unescape_string('1\\n2,3'), '1\n2,3')
+    
+    def test_escaped_backslash_before_n(self):
+        """Test that '\\\\n' becomes a backslash followed by 'n', not a backslash and a newline."""
+        self.assertEqual(unescape_string('1\\\\n2'), '1\\n2')
+    
+    def test_no_backslash_returned_unchanged(self):
+        """Test that strings without backslashes are returned as they are."""
+        numbers = '//;\n1;2'
+        self.assertIs(unescape_string(numbers), numbers)
+        self.assertEqual(unescape_string(''), '')
+    
+    def test_lone_trailing_backslash(self):
+        """Test that a backslash at the end of the string is kept."""
+        self.assertEqual(unescape_string('1,2\\'), '1,2\\')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,28 +6,163 @@ A simple Flask web application for testing the String Calculator implementation.
 
 import sys
 import os
-from flask import Flask, render_template, request, jsonify
+import re
+import time
+import logging
+from flask import Flask, Request, Response, g, render_template, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
 
 # Add the parent directory to the path to import string_calculator
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from string_calculator.string_calculator import StringCalculator
+from string_calculator.string_calculator import InputTooLargeError, StringCalculator
+from request_logging import RequestLogger
+import metrics
+
+
+class CalculatorRequest(Request):
+    """Request that exempts the streaming endpoint from the body size limit."""
+    
+    @property
+    def max_content_length(self):
+        # The stream is parsed while it is read, so its size is not held in memory
+        if self.endpoint == 'calculate_stream':
+            return None
+        return super().max_content_length
+
 
 app = Flask(__name__)
-calculator = StringCalculator()
+app.request_class = CalculatorRequest
+app.config['MAX_BATCH_SIZE'] = int(os.environ.get('MAX_BATCH_SIZE', 1000))
+app.config['STREAM_CHUNK_SIZE'] = int(os.environ.get('STREAM_CHUNK_SIZE', 64 * 1024))
+app.config['RESULT_CACHE_SIZE'] = int(os.environ.get('RESULT_CACHE_SIZE', 1024))
+# Size limits for buffered requests; 0 disables a limit
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', 10 * 1024 * 1024)) or None
+app.config['MAX_NUMBERS'] = int(os.environ.get('MAX_NUMBERS', 1000000)) or None
+app.config['MAX_DELIMITERS'] = int(os.environ.get('MAX_DELIMITERS', 100)) or None
+app.config['MAX_DELIMITER_LENGTH'] = int(os.environ.get('MAX_DELIMITER_LENGTH', 1000)) or None
+# Report at most MAX_NEGATIVES negatives so error responses stay small
+app.config['NEGATIVE_POLICY'] = os.environ.get('NEGATIVE_POLICY', 'collect-up-to')
+app.config['MAX_NEGATIVES'] = int(os.environ.get('MAX_NEGATIVES', 100))
+calculator = StringCalculator(
+    result_cache_size=app.config['RESULT_CACHE_SIZE'],
+    max_numbers=app.config['MAX_NUMBERS'],
+    max_delimiters=app.config['MAX_DELIMITERS'],
+    max_delimiter_length=app.config['MAX_DELIMITER_LENGTH'],
+    profiler=metrics.PrometheusProfiler(),
+    negative_policy=app.config['NEGATIVE_POLICY'],
+    max_negatives=app.config['MAX_NEGATIVES']
+)
+request_logger = RequestLogger.from_env()
+
+# Escape sequences understood by unescape_string, decoded left to right
+ESCAPE_SEQUENCES = {
+    '\\n': '\n',   # \n to actual newline
+    '\\t': '\t',   # \t to actual tab
+    '\\r': '\r',   # \r to actual carriage return
+    '\\\\': '\\'  # \\ to single \
+}
+ESCAPE_PATTERN = re.compile(r'\\[ntr\\]')
+
+# Endpoints whose requests are counted and timed in the metrics
+METERED_ENDPOINTS = {'calculate', 'calculate_batch', 'calculate_stream'}
+
+# Example calculations shown in the UI
+EXAMPLES = [
+    {
+        'input': '',
+        'description': 'Empty string',
+        'expected': '0'
+    },
+    {
+        'input': '1',
+        'description': 'Single number',
+        'expected': '1'
+    },
+    {
+        'input': '1,2',
+        'description': 'Two numbers',
+        'expected': '3'
+    },
+    {
+        'input': '1,2,3,4,5',
+        'description': 'Multiple numbers',
+        'expected': '15'
+    },
+    {
+        'input': '1\n2,3',
+        'description': 'Newline separators',
+        'expected': '6'
+    },
+    {
+        'input': '//;\n1;2;3',
+        'description': 'Custom delimiter (semicolon)',
+        'expected': '6'
+    },
+    {
+        'input': '//[*][%]\n1*2%3',
+        'description': 'Multiple custom delimiters',
+        'expected': '6'
+    },
+    {
+        'input': '//[***]\n1***2***3',
+        'description': 'Arbitrary length delimiter',
+        'expected': '6'
+    },
+    {
+        'input': '1001,2,3000',
+        'description': 'Large numbers (ignores >1000)',
+        'expected': '2'
+    },
+    {
+        'input': '1,-2,3',
+        'description': 'Negative numbers (should throw error)',
+        'expected': 'Error: negative numbers not allowed: -2'
+    }
+]
+
+def warm_up():
+    """Run the examples once so the calculator's delimiter cache is compiled."""
+    # Warm-up calls are not traffic, so the profiler does not record them
+    profiler, calculator.profiler = calculator.profiler, None
+    try:
+        for example in EXAMPLES:
+            try:
+                calculator.add(example['input'])
+            except ValueError:
+                pass
+    finally:
+        calculator.profiler = profiler
+    metrics.skip_caches(calculator)
+
+def too_large(error):
+    """Build the 413 response for inputs over a size limit, pointing clients at the streaming endpoint."""
+    return jsonify({'result': None, 'error': error, 'stream_endpoint': '/calculate/stream'}), 413
 
 def unescape_string(s):
-    """Convert escaped strings like '1\\n2,3' to proper format '1\n2,3'"""
-    if not s:
+    """Convert escaped strings like '1\\n2,3' to proper format '1\n2,3' in a single pass"""
+    if not s or '\\' not in s:
         return s
     
-    # Replace common escape sequences
-    s = s.replace('\\n', '\n')  # Convert \n to actual newline
-    s = s.replace('\\t', '\t')  # Convert \t to actual tab
-    s = s.replace('\\r', '\r')  # Convert \r to actual carriage return
-    s = s.replace('\\\\', '\\') # Convert \\ to single \
-    
-    return s
+    # One left-to-right pass, so '\\\\n' becomes a backslash followed by 'n'
+    return ESCAPE_PATTERN.sub(lambda match: ESCAPE_SEQUENCES[match.group()], s)
+
+@app.before_request
+def start_timer():
+    """Note when the request started, for the latency metrics."""
+    g.started = time.perf_counter()
+
+@app.after_request
+def record_metrics(response):
+    """Count and time calculation requests by outcome."""
+    if request.endpoint in METERED_ENDPOINTS:
+        # Handlers set the outcome where the status code alone does not tell it
+        outcome = g.get('outcome')
+        if outcome is None:
+            outcome = {200: 'success', 413: 'too_large'}.get(response.status_code, 'bad_request')
+        metrics.observe_request(request.endpoint, outcome, time.perf_counter() - g.started, request.content_length)
+        metrics.observe_caches(calculator)
+    return response
 
 @app.route('/')
 def index():
@@ -37,103 +172,144 @@ def index():
 @app.route('/calculate', methods=['POST'])
 def calculate():
     """API endpoint to calculate the sum of numbers."""
+    sampled = request_logger.sample()
+    started = g.started
+    numbers = ''
+    
     try:
         data = request.get_json()
-        numbers = data.get('numbers', '')
-        
-        # Debug: Print the received data
-        print("=" * 50)
-        print("🔍 DEBUG: Data received for calculation")
-        print("=" * 50)
-        print(f"Raw JSON data: {data}")
-        print(f"Numbers string (before unescape): {repr(numbers)}")
-        print(f"Numbers length (before): {len(numbers)}")
-        print(f"Characters (before): {[ord(c) for c in numbers]}")
-        
-        # Unescape the string
-        numbers = unescape_string(numbers)
-        
-        print(f"Numbers string (after unescape): {repr(numbers)}")
-        print(f"Numbers length (after): {len(numbers)}")
-        print(f"Characters (after): {[ord(c) for c in numbers]}")
-        print("=" * 50)
+        numbers = unescape_string(data.get('numbers', ''))
         
         if not numbers:
-            print("Empty input detected, returning 0")
-            return jsonify({'result': 0, 'error': None})
+            result = 0
+        else:
+            result = calculator.add(numbers)
         
-        print(f"Calling calculator.add() with: {repr(numbers)}")
-        result = calculator.add(numbers)
-        print(f"Calculator returned: {result}")
-        print("=" * 50)
+        if sampled:
+            request_logger.log(
+                'calculate', outcome='success', result=result,
+                numbers_length=len(numbers), numbers_preview=request_logger.preview(numbers),
+                duration_ms=round((time.perf_counter() - started) * 1000, 3)
+            )
         
         return jsonify({'result': result, 'error': None})
         
+    except RequestEntityTooLarge as e:
+        if sampled:
+            request_logger.log('calculate', outcome='too_large', content_length=request.content_length)
+        return request_entity_too_large(e)
+    except InputTooLargeError as e:
+        if sampled:
+            request_logger.log(
+                'calculate', outcome='too_large', error=str(e),
+                numbers_length=len(numbers), numbers_preview=request_logger.preview(numbers),
+                duration_ms=round((time.perf_counter() - started) * 1000, 3)
+            )
+        return too_large(str(e))
     except ValueError as e:
-        print(f"ValueError caught: {e}")
+        g.outcome = metrics.classify_error(e)
+        if sampled:
+            request_logger.log(
+                'calculate', outcome='invalid_input', error=str(e),
+                numbers_length=len(numbers), numbers_preview=request_logger.preview(numbers),
+                duration_ms=round((time.perf_counter() - started) * 1000, 3)
+            )
         return jsonify({'result': None, 'error': str(e)})
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        g.outcome = 'unexpected_error'
+        # Unexpected errors are always logged, regardless of sampling
+        request_logger.log(
+            'calculate', level=logging.ERROR, outcome='unexpected_error', error=repr(e),
+            numbers_length=len(numbers), numbers_preview=request_logger.preview(numbers)
+        )
+        return jsonify({'result': None, 'error': f'Unexpected error: {str(e)}'})
+
+@app.route('/calculate/batch', methods=['POST'])
+def calculate_batch():
+    """API endpoint to calculate the sums for a batch of inputs in one request."""
+    data = request.get_json(silent=True)
+    inputs = data.get('inputs') if isinstance(data, dict) else data
+    
+    if not isinstance(inputs, list) or not all(isinstance(item, str) for item in inputs):
+        return jsonify({'error': 'Expected a JSON array of input strings'}), 400
+    
+    max_batch_size = app.config['MAX_BATCH_SIZE']
+    if len(inputs) > max_batch_size:
+        return jsonify({'error': f'Batch too large: {len(inputs)} inputs (maximum {max_batch_size})'}), 413
+    
+    try:
+        # Evaluate the whole batch together, collecting per-input errors
+        results = calculator.add_many([unescape_string(item) for item in inputs], on_error='collect')
+    except Exception as e:
+        g.outcome = 'unexpected_error'
+        # Unexpected errors are always logged, regardless of sampling
+        request_logger.log(
+            'calculate_batch', level=logging.ERROR, outcome='unexpected_error', error=repr(e),
+            inputs=len(inputs), inputs_length=sum(map(len, inputs))
+        )
+        # A 500 keeps the error apart from a batch of per-input results
+        return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+    
+    return jsonify([
+        {'result': None, 'error': str(item)} if isinstance(item, ValueError) else {'result': item, 'error': None}
+        for item in results
+    ])
+
+@app.route('/calculate/stream', methods=['POST'])
+def calculate_stream():
+    """API endpoint to calculate the sum of a raw text body, parsed while it is read."""
+    if request.mimetype not in ('', 'text/plain', 'application/octet-stream'):
+        return jsonify({'result': None, 'error': 'Expected a text/plain or application/octet-stream body'}), 415
+    
+    sampled = request_logger.sample()
+    started = g.started
+    
+    try:
+        # The body is the calculator input itself: no JSON decoding and no unescaping
+        result = calculator.add_stream(request.stream, chunk_size=app.config['STREAM_CHUNK_SIZE'])
+        outcome, error = 'success', None
+    except ValueError as e:
+        result, outcome, error = None, 'invalid_input', str(e)
+        g.outcome = metrics.classify_error(e)
+    except Exception as e:
+        g.outcome = 'unexpected_error'
+        # Unexpected errors are always logged, regardless of sampling
+        request_logger.log(
+            'calculate_stream', level=logging.ERROR, outcome='unexpected_error', error=repr(e),
+            content_length=request.content_length
+        )
         return jsonify({'result': None, 'error': f'Unexpected error: {str(e)}'})
+    
+    if sampled:
+        request_logger.log(
+            'calculate_stream', outcome=outcome, result=result, error=error,
+            content_length=request.content_length,
+            duration_ms=round((time.perf_counter() - started) * 1000, 3)
+        )
+    
+    return jsonify({'result': result, 'error': error})
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_entity_too_large(e):
+    """Answer oversized bodies on the other endpoints with JSON rather than HTML."""
+    return too_large(f"Request body too large (maximum {app.config['MAX_CONTENT_LENGTH']} bytes)")
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Expose request, latency, size and cache metrics in the Prometheus text format."""
+    body, content_type = metrics.render()
+    return Response(body, content_type=content_type)
 
 @app.route('/examples')
 def examples():
     """Get example calculations for the UI."""
-    examples = [
-        {
-            'input': '',
-            'description': 'Empty string',
-            'expected': '0'
-        },
-        {
-            'input': '1',
-            'description': 'Single number',
-            'expected': '1'
-        },
-        {
-            'input': '1,2',
-            'description': 'Two numbers',
-            'expected': '3'
-        },
-        {
-            'input': '1,2,3,4,5',
-            'description': 'Multiple numbers',
-            'expected': '15'
-        },
-        {
-            'input': '1\n2,3',
-            'description': 'Newline separators',
-            'expected': '6'
-        },
-        {
-            'input': '//;\n1;2;3',
-            'description': 'Custom delimiter (semicolon)',
-            'expected': '6'
-        },
-        {
-            'input': '//[*][%]\n1*2%3',
-            'description': 'Multiple custom delimiters',
-            'expected': '6'
-        },
-        {
-            'input': '//[***]\n1***2***3',
-            'description': 'Arbitrary length delimiter',
-            'expected': '6'
-        },
-        {
-            'input': '1001,2,3000',
-            'description': 'Large numbers (ignores >1000)',
-            'expected': '2'
-        },
-        {
-            'input': '1,-2,3',
-            'description': 'Negative numbers (should throw error)',
-            'expected': 'Error: negative numbers not allowed: -2'
-        }
-    ]
-    return jsonify(examples)
+    return jsonify(EXAMPLES)
 
 if __name__ == '__main__':
+    # Log every request on the development server unless configured otherwise
+    if 'REQUEST_LOG_SAMPLE_RATE' not in os.environ:
+        request_logger.sample_rate = 1
+    
     print("Starting String Calculator Web UI...")
     print("Open your browser and go to: http://localhost:5000")
     app.run(debug=True, host='0.0.0.0', port=5000)
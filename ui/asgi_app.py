@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+String Calculator ASGI API
+An asyncio front end for the /calculate, /calculate/batch and /examples API,
+for serving many concurrent connections from one process:
+
+    uvicorn asgi_app:app --app-dir ui --host 0.0.0.0 --port 8000
+
+Small inputs are calculated directly on the event loop. Large inputs are
+offloaded to a process pool so the loop stays responsive to small requests;
+at most ASGI_MAX_CONCURRENCY offloaded calculations run at once and at most
+ASGI_MAX_QUEUE wait for a slot, beyond which requests get 503 responses.
+
+Environment variables:
+    ASGI_OFFLOAD_THRESHOLD: input characters from which work is offloaded (default 16384)
+    ASGI_WORKERS: worker processes in the pool (default: CPU count)
+    ASGI_MAX_CONCURRENCY: offloaded calculations running at once (default: ASGI_WORKERS)
+    ASGI_MAX_QUEUE: offloaded calculations waiting for a slot (default 64)
+    MAX_BATCH_SIZE: maximum inputs per batch request (default 1000)
+    MAX_CONTENT_LENGTH: maximum request body size in bytes (default 10 MiB, 0 for no limit)
+
+Number and delimiter limits (MAX_NUMBERS, MAX_DELIMITERS, MAX_DELIMITER_LENGTH)
+are shared with the Flask app's calculator. Inputs over any limit get 413 responses.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app import EXAMPLES, calculator, request_logger, unescape_string
+from string_calculator.string_calculator import InputTooLargeError
+
+OFFLOAD_THRESHOLD = int(os.environ.get('ASGI_OFFLOAD_THRESHOLD', 16 * 1024))
+WORKERS = int(os.environ.get('ASGI_WORKERS', 0)) or os.cpu_count() or 1
+MAX_CONCURRENCY = int(os.environ.get('ASGI_MAX_CONCURRENCY', 0)) or WORKERS
+MAX_QUEUE = int(os.environ.get('ASGI_MAX_QUEUE', 64))
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 1000))
+MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 10 * 1024 * 1024)) or None
+
+
+def calculate_numbers(numbers):
+    """Calculate one input, returning (result, error, status) so it can cross process boundaries."""
+    try:
+        return calculator.add(numbers), None, 200
+    except InputTooLargeError as e:
+        return None, str(e), 413
+    except ValueError as e:
+        return None, str(e), 200
+
+
+def calculate_inputs(inputs):
+    """Calculate a batch of inputs, returning a (result, error) pair for each."""
+    return [
+        (None, str(item)) if isinstance(item, ValueError) else (item, None)
+        for item in calculator.add_many(inputs, on_error='collect')
+    ]
+
+
+class Overloaded(Exception):
+    """Raised when the offload queue is full."""
+
+
+class BodyTooLarge(Exception):
+    """Raised when a request body is larger than MAX_CONTENT_LENGTH."""
+
+
+class OffloadLimiter:
+    """
+    Limits how many calculations run in the pool and how many wait for a slot.
+    
+    Requests beyond the queue limit are rejected immediately instead of
+    waiting, so the server sheds load rather than building an unbounded backlog.
+    """
+    
+    def __init__(self, max_concurrency, max_queue):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.running = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def __aenter__(self):
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise Overloaded()
+            
+            self.waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        
+        self.running += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.running -= 1
+        self._semaphore.release()
+
+
+class CalculationService:
+    """Runs calculations inline or in the worker pool depending on input size."""
+    
+    def __init__(self, offload_threshold=OFFLOAD_THRESHOLD, workers=WORKERS,
+                 max_concurrency=MAX_CONCURRENCY, max_queue=MAX_QUEUE):
+        self.offload_threshold = offload_threshold
+        self.workers = workers
+        self.limiter = OffloadLimiter(max_concurrency, max_queue)
+        self._executor = None
+    
+    async def run(self, function, argument, size):
+        """
+        Run function(argument), offloading it to the pool when size is large.
+        
+        Raises:
+            Overloaded: If the offload queue is full
+        """
+        if size < self.offload_threshold:
+            return function(argument)
+        
+        async with self.limiter:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, argument)
+    
+    def shutdown(self):
+        """Stop the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+service = CalculationService()
+
+
+async def read_json(scope, receive, max_length=MAX_CONTENT_LENGTH):
+    """
+    Read the request body and decode it as JSON, returning None if it is not valid JSON.
+    
+    Raises:
+        BodyTooLarge: If the body is longer than max_length, checked against the
+            Content-Length header before reading and against the bytes received so far
+    """
+    if max_length is not None:
+        content_length = dict(scope['headers']).get(b'content-length')
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_length:
+            raise BodyTooLarge()
+    
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if max_length is not None and size > max_length:
+            raise BodyTooLarge()
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            break
+    
+    try:
+        return json.loads(b''.join(chunks))
+    except ValueError:
+        return None
+
+
+async def send_json(send, payload, status=200, headers=()):
+    """Send a JSON response."""
+    body = json.dumps(payload).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('ascii')),
+            *headers
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def send_overloaded(send, payload):
+    """Send a 503 response asking the client to retry."""
+    await send_json(send, payload, status=503, headers=[(b'retry-after', b'1')])
+
+
+async def send_too_large(send, error):
+    """Send a 413 response pointing the client at the streaming endpoint of the Flask app."""
+    await send_json(send, {'result': None, 'error': error, 'stream_endpoint': '/calculate/stream'}, status=413)
+
+
+def body_too_large_error():
+    """Get the error message for request bodies over MAX_CONTENT_LENGTH."""
+    return f'Request body too large (maximum {MAX_CONTENT_LENGTH} bytes)'
+
+
+async def calculate(scope, receive, send):
+    """API endpoint to calculate the sum of numbers."""
+    sampled = request_logger.sample()
+    started = time.perf_counter() if sampled else None
+    
+    try:
+        data = await read_json(scope, receive)
+    except BodyTooLarge:
+        await send_too_large(send, body_too_large_error())
+        return
+    
+    numbers = data.get('numbers', '') if isinstance(data, dict) else None
+    if not isinstance(numbers, str):
+        await send_json(send, {'result': None, 'error': 'Expected a JSON object with a "numbers" string'}, status=400)
+        return
+    
+    numbers = unescape_string(numbers)
+    try:
+        result, error, status = await service.run(calculate_numbers, numbers, len(numbers))
+    except Overloaded:
+        await send_overloaded(send, {'result': None, 'error': 'Server busy, try again later'})
+        return
+    except Exception as e:
+        # Unexpected errors are always logged, regardless of sampling
+        request_logger.log(
+            'calculate', level=logging.ERROR, outcome='unexpected_error', error=repr(e),
+            numbers_length=len(numbers), numbers_preview=request_logger.preview(numbers)
+        )
+        await send_json(send, {'result': None, 'error': f'Unexpected error: {str(e)}'})
+        return
+    
+    if sampled:
+        outcome = 'success' if error is None else 'too_large' if status == 413 else 'invalid_input'
+        request_logger.log(
+            'calculate', outcome=outcome, result=result, error=error,
+            numbers_length=len(numbers), numbers_preview=request_logger.preview(numbers),
+            duration_ms=round((time.perf_counter() - started) * 1000, 3)
+        )
+    
+    if status == 413:
+        await send_too_large(send, error)
+        return
+    
+    await send_json(send, {'result': result, 'error': error})
+
+
+async def calculate_batch(scope, receive, send):
+    """API endpoint to calculate the sums for a batch of inputs in one request."""
+    try:
+        data = await read_json(scope, receive)
+    except BodyTooLarge:
+        await send_too_large(send, body_too_large_error())
+        return
+    
+    inputs = data.get('inputs') if isinstance(data, dict) else data
+    
+    if not isinstance(inputs, list) or not all(isinstance(item, str) for item in inputs):
+        await send_json(send, {'error': 'Expected a JSON array of input strings'}, status=400)
+        return
+    
+    if len(inputs) > MAX_BATCH_SIZE:
+        await send_json(send, {'error': f'Batch too large: {len(inputs)} inputs (maximum {MAX_BATCH_SIZE})'}, status=413)
+        return
+    
+    inputs = [unescape_string(item) for item in inputs]
+    try:
+        results = await service.run(calculate_inputs, inputs, sum(map(len, inputs)))
+    except Overloaded:
+        await send_overloaded(send, {'error': 'Server busy, try again later'})
+        return
+    except Exception as e:
+        # Unexpected errors are always logged, regardless of sampling
+        request_logger.log(
+            'calculate_batch', level=logging.ERROR, outcome='unexpected_error', error=repr(e),
+            inputs=len(inputs), inputs_length=sum(map(len, inputs))
+        )
+        # A 500 keeps the error apart from a batch of per-input results
+        await send_json(send, {'error': f'Unexpected error: {str(e)}'}, status=500)
+        return
+    
+    await send_json(send, [{'result': result, 'error': error} for result, error in results])
+
+
+async def examples(scope, receive, send):
+    """Get example calculations for the UI."""
+    await send_json(send, EXAMPLES)
+
+
+# Path -> (method, handler)
+ROUTES = {
+    '/calculate': ('POST', calculate),
+    '/calculate/batch': ('POST', calculate_batch),
+    '/examples': ('GET', examples),
+}
+
+
+async def lifespan(receive, send):
+    """Handle ASGI lifespan events, stopping the worker pool on shutdown."""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            service.shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI application entry point."""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    
+    route = ROUTES.get(scope['path'])
+    if route is None:
+        await send_json(send, {'error': 'Not found'}, status=404)
+        return
+    
+    method, handler = route
+    if scope['method'] != method and not (method == 'GET' and scope['method'] == 'HEAD'):
+        await send_json(send, {'error': 'Method not allowed'}, status=405, headers=[(b'allow', method.encode('ascii'))])
+        return
+    
+    await handler(scope, receive, send)
@@ -0,0 +1,70 @@
+"""
+Gunicorn configuration for serving the String Calculator Web UI in production.
+
+    gunicorn --config ui/gunicorn.conf.py
+
+The application is preloaded in the master process and its calculator is
+warmed up before workers are forked, so the compiled delimiter scanners are
+shared copy-on-write instead of being rebuilt by every worker.
+
+Environment variables:
+    PORT: port to listen on (default 5000)
+    WEB_CONCURRENCY: number of worker processes (default 2 * CPU count + 1)
+    GUNICORN_THREADS: threads per worker (default 4)
+    GUNICORN_MAX_REQUESTS: requests served before a worker is recycled (default 10000)
+    GUNICORN_KEEPALIVE: seconds to keep idle connections open (default 5)
+    GUNICORN_TIMEOUT: seconds before a silent worker is restarted (default 30)
+    PROMETHEUS_MULTIPROC_DIR: empty directory the workers write metrics to
+        (default: a new temporary directory)
+"""
+
+import gc
+import multiprocessing
+import os
+import tempfile
+
+# Metrics from every worker are written to a shared directory and summed by
+# /metrics; this must be set before the app imports prometheus_client
+if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='string-calculator-metrics-')
+
+# Application
+chdir = os.path.dirname(os.path.abspath(__file__))
+wsgi_app = 'app:app'
+preload_app = True
+
+# Server socket
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+backlog = 2048
+
+# Worker processes
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Threaded workers keep idle keep-alive connections without blocking a process
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+
+# Recycle workers periodically; the jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+# Keep-alive for clients and load balancers that reuse connections
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Logging
+accesslog = None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def when_ready(server):
+    """Warm up the preloaded calculator in the master, before workers are forked."""
+    import app
+
+    app.warm_up()
+
+    # Keep the warmed objects out of the collector so workers do not touch
+    # (and copy) their pages
+    gc.freeze()
+    server.log.info("Calculator warmed up; forking %s workers", workers)
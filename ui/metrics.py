@@ -0,0 +1,140 @@
+"""
+Prometheus metrics for the String Calculator Web UI.
+
+Request outcomes, latencies and sizes are recorded per endpoint, the
+calculator's stage timings and token counts come from its profiler hook, and
+new delimiter and result cache hits and misses are counted after each
+request. The profiler only sees add() calls that calculate an input, so
+result cache hits, streamed bodies and batch items summed together by
+add_many() are not in the stage and numbers histograms. The /metrics endpoint renders them in the Prometheus text format.
+
+With several gunicorn workers each process has its own counters, so
+PROMETHEUS_MULTIPROC_DIR must point to a directory shared by the workers
+(ui/gunicorn.conf.py sets one up); metrics are then written to memory-mapped
+files there and /metrics sums them across all workers.
+
+Environment variables:
+    PROMETHEUS_MULTIPROC_DIR: directory for multiprocess metric files (unset for a single process)
+"""
+
+import os
+import threading
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+from string_calculator.string_calculator import NegativeNumbersError
+
+# Latency buckets in seconds, from cached lookups to large inputs
+SECONDS_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+TOKENS_BUCKETS = (1, 2, 5, 10, 100, 1000, 10000, 100000, 1000000)
+
+REQUESTS = Counter(
+    'string_calculator_requests_total', 'Requests handled, by endpoint and outcome',
+    ['endpoint', 'outcome']
+)
+REQUEST_SECONDS = Histogram(
+    'string_calculator_request_duration_seconds', 'Time spent handling requests',
+    ['endpoint'], buckets=SECONDS_BUCKETS
+)
+REQUEST_BYTES = Histogram(
+    'string_calculator_request_bytes', 'Request body sizes',
+    ['endpoint'], buckets=BYTES_BUCKETS
+)
+STAGE_SECONDS = Histogram(
+    'string_calculator_stage_duration_seconds', 'Time spent in each stage of a calculation',
+    ['stage'], buckets=SECONDS_BUCKETS
+)
+INPUT_TOKENS = Histogram(
+    'string_calculator_input_numbers',
+    'Numbers (delimiter-separated tokens) per input calculated by add(), excluding result cache hits',
+    buckets=TOKENS_BUCKETS
+)
+CACHE_LOOKUPS = Counter(
+    'string_calculator_cache_lookups_total', 'Calculator cache lookups, by cache and result',
+    ['cache', 'result']
+)
+
+# Cache counters already reported, so only new lookups are counted
+_reported = {}
+_reported_lock = threading.Lock()
+
+
+class PrometheusProfiler:
+    """
+    Calculator profiler that records stage timings and token counts as Prometheus histograms.
+    
+    Only add() calls that calculate their input are recorded: result cache
+    hits, add_stream() and inputs add_many() sums in bulk never reach it.
+    """
+    
+    def __init__(self):
+        self._stages = {}
+    
+    def record(self, stages, tokens, nbytes, error):
+        """Observe the stage times and token count of one add() call."""
+        for stage, seconds in stages.items():
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = STAGE_SECONDS.labels(stage)
+            histogram.observe(seconds)
+        INPUT_TOKENS.observe(tokens)
+
+
+def classify_error(error):
+    """Get the outcome label for a ValueError raised by the calculator."""
+    if isinstance(error, NegativeNumbersError):
+        return 'negative_numbers'
+    return 'invalid_format'
+
+
+def observe_request(endpoint, outcome, seconds, content_length):
+    """Record one handled request."""
+    REQUESTS.labels(endpoint, outcome).inc()
+    REQUEST_SECONDS.labels(endpoint).observe(seconds)
+    if content_length is not None:
+        REQUEST_BYTES.labels(endpoint).observe(content_length)
+
+
+def _cache_counters(calculator):
+    """Get the calculator's cumulative cache counters keyed by (cache, result)."""
+    counters = {}
+    for cache, info in (('delimiter', calculator.delimiter_cache_info()),
+                        ('result', calculator.result_cache_info())):
+        counters[cache, 'hit'] = info['hits']
+        counters[cache, 'miss'] = info['misses']
+    return counters
+
+
+def observe_caches(calculator):
+    """Count the cache hits and misses since the last call."""
+    with _reported_lock:
+        for key, value in _cache_counters(calculator).items():
+            previous = _reported.get(key, 0)
+            # A cleared cache restarts its counters from zero
+            new = value - previous if value >= previous else value
+            if new:
+                CACHE_LOOKUPS.labels(*key).inc(new)
+            _reported[key] = value
+
+
+def skip_caches(calculator):
+    """Leave the cache lookups made so far (e.g. while warming up) out of the metrics."""
+    with _reported_lock:
+        _reported.update(_cache_counters(calculator))
+
+
+def render():
+    """
+    Render all metrics in the Prometheus text format.
+    
+    Returns:
+        Tuple of (body, content type)
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    
+    return generate_latest(), CONTENT_TYPE_LATEST
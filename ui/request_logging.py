@@ -0,0 +1,72 @@
+"""
+Structured, sampled request logging for the String Calculator Web UI.
+
+Logging is off unless a sample rate is configured, and only 1 in N requests
+is logged, so the hot path pays for a counter increment at most. Payloads are
+logged as truncated previews, never in full.
+
+Environment variables:
+    REQUEST_LOG_SAMPLE_RATE: log 1 in N requests (0 disables, the default)
+    REQUEST_LOG_PREVIEW_CHARS: characters of the input shown in previews (default 80)
+"""
+
+import itertools
+import json
+import logging
+import os
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+    
+    def format(self, record):
+        payload = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'event': record.getMessage()
+        }
+        payload.update(getattr(record, 'fields', {}))
+        return json.dumps(payload, default=str)
+
+
+class RequestLogger:
+    """Sampled logger that writes structured request events."""
+    
+    def __init__(self, name='string_calculator.requests', sample_rate=0, preview_chars=80):
+        self.logger = logging.getLogger(name)
+        self.sample_rate = sample_rate
+        self.preview_chars = preview_chars
+        self._counter = itertools.count()
+        
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(JsonFormatter())
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False
+    
+    @classmethod
+    def from_env(cls, name='string_calculator.requests'):
+        """Create a logger configured from environment variables."""
+        return cls(
+            name=name,
+            sample_rate=int(os.environ.get('REQUEST_LOG_SAMPLE_RATE', 0)),
+            preview_chars=int(os.environ.get('REQUEST_LOG_PREVIEW_CHARS', 80))
+        )
+    
+    def sample(self):
+        """Return True if the current request should be logged."""
+        if self.sample_rate <= 0:
+            return False
+        return next(self._counter) % self.sample_rate == 0
+    
+    def preview(self, text):
+        """Return the start of text, noting how many characters were cut."""
+        if len(text) <= self.preview_chars:
+            return text
+        return f"{text[:self.preview_chars]}... (+{len(text) - self.preview_chars} chars)"
+    
+    def log(self, event, level=logging.INFO, **fields):
+        """Write one structured event."""
+        self.logger.log(level, event, extra={'fields': fields})